@@ -0,0 +1,249 @@
+"""Micro-benchmarks of the data-layer hot paths on synthetic data at several scales.
+
+    python benchmarks/hot_paths.py [--scales small,medium,large] [--storage json|sqlite|memory] [--calls 20]
+                                   [--anchor 2025-12-31] [--out hot_paths.json] [--compare previous.json]
+    python benchmarks/hot_paths.py --generate DIR [--users 100] [--days 365] [--anchor 2025-12-31]
+
+Each scale gets a fresh data directory filled by a deterministic generator (same seed,
+same data, ending on a fixed --anchor date that the query ranges end on too): users spread over teams, a weekday-shaped sales history
+drawn from per-product weights, several bonus schedules, targeted messages with some
+receipts, and one session per user. A child interpreter then times every case twice:
+`uncached` clears the data and session caches before each call, `cached` repeats the
+call on a warm cache. With --storage memory the Firestore code path runs against the
+in-memory stand-in and each case also reports the document reads of an uncached call;
+there the read counts are what carries over to Firestore, the timings have no network in them.
+Results are JSON with the commit and anchor they were measured on; --compare prints the
+median ratio against an earlier results file, and refuses one generated up to another anchor.
+"""
+import argparse, json, math, os, platform, random, statistics, subprocess, sys, tempfile, time
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SCALES = {
+    "small": {"users": 20, "days": 90},
+    "medium": {"users": 100, "days": 365},
+    "large": {"users": 250, "days": 730},
+}
+# rough share of each product among sales lines
+PRODUCT_WEIGHTS = {
+    "fiber_new": 30, "copper_new": 12, "mesh_copper": 8, "bspot_copper": 5, "mesh_fiber": 10,
+    "upgrade_fiber_to_fiber": 10, "cyber_plus": 15, "biznet_copper": 4, "bizfiber_fiber": 3,
+    "upgrade_biznet_to_bizfiber": 3,
+}
+BASE_PRICES = {"fiber_new": 23, "copper_new": 10, "mesh_copper": 5, "bspot_copper": 10, "mesh_fiber": 10,
+               "upgrade_fiber_to_fiber": 8, "cyber_plus": 10, "biznet_copper": 43, "bizfiber_fiber": 73,
+               "upgrade_biznet_to_bizfiber": 20}
+# last day of the generated history; fixed so runs on different days measure the same data
+ANCHOR = date(2025, 12, 31)
+# chance that an agent sells on a given weekday (Mon..Sun); Friday is short, Saturday is off
+DAY_ACTIVITY = [0.85, 0.85, 0.85, 0.85, 0.3, 0.03, 0.85]
+
+
+def generate(data_dir: Path, users: int = 100, days: int = 365, teams: int | None = None, schedules: int = 4, seed: int = 0,
+             anchor: date = ANCHOR) -> dict:
+    """Write a synthetic data/ directory of `days` ending on `anchor`; the same arguments always give the same data."""
+    rnd = random.Random(seed)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    today = anchor
+    teams = teams or max(2, users // 12)
+    codes, weights = list(PRODUCT_WEIGHTS), list(PRODUCT_WEIGHTS.values())
+
+    accounts, sessions = {}, {}
+    for i in range(users):
+        email = f"agent{i}@example.com"
+        accounts[email] = {"name": f"Agent {i}", "email": email, "team": str(i % teams + 1), "invisible": i % 25 == 24,
+                           "password": "pbkdf2$bench$0", "created_at": "2024-01-01T00:00:00+02:00",
+                           "goals": {"daily": 100, "weekly": 500, "monthly": 2000},
+                           "color": f"#{rnd.randrange(0x1000000):06x}", "is_admin": i == 0}
+        sessions[f"bench-{i}"] = {"email": email, "created_at": "2024-01-01T00:00:00+02:00", "expires_at": "2099-01-01T00:00:00+02:00"}
+
+    records = []
+    for email in accounts:
+        pace = rnd.uniform(0.5, 1.5)
+        for k in range(days):
+            day = today - timedelta(days=k)
+            if rnd.random() > DAY_ACTIVITY[day.weekday()]:
+                continue
+            lines = min(len(codes), max(1, round(rnd.choices([1, 2, 3, 4], [4, 3, 2, 1])[0] * pace)))
+            picked = set()
+            while len(picked) < lines:
+                picked.add(rnd.choices(codes, weights)[0])
+            for code in sorted(picked):
+                records.append({"email": email, "date": day.isoformat(), "product": code,
+                                "qty": rnd.choices([1, 2, 3, 4, 5], [50, 25, 12, 8, 5])[0],
+                                "ts": f"{day.isoformat()}T{rnd.randint(8, 19):02d}:{rnd.randint(0, 59):02d}:00+03:00"})
+
+    # a base price list plus schedules spread over the history, each moving a few prices
+    plans = [{"effective_date": "1970-01-01", "prices": dict(BASE_PRICES)}]
+    for n in range(1, schedules):
+        effective = today - timedelta(days=days - days * n // schedules)
+        plans.append({"effective_date": effective.isoformat(),
+                      "prices": {c: max(1, BASE_PRICES[c] + rnd.randint(-5, 10)) for c in rnd.sample(codes, 4)}})
+
+    messages, inbox = [], {}
+    targets = [{"target_all": True}] + [{"target_teams": [str(t + 1)]} for t in range(teams)]
+    targets += [{"target_emails": rnd.sample(list(accounts), min(3, users))} for _ in range(max(1, users // 10))]
+    for n, target in enumerate(targets):
+        messages.append({"id": f"msg-{n}", "title": f"הודעה {n}", "text": "עדכון", "target_all": False, "target_teams": [],
+                         "target_emails": [], **target, "created_at": f"{today - timedelta(days=n)}T09:00:00+03:00",
+                         "active": True, "sticky": n % 5 == 0, "meta": {}, "sender": "system"})
+    for email in accounts:
+        for m in messages:
+            if rnd.random() < 0.3:
+                inbox.setdefault(email, {})[m["id"]] = f"{today}T12:00:00+03:00"
+
+    files = {
+        "users.json": {"users": accounts},
+        "records.json": {"records": records},
+        "bonuses.json": {"schedules": plans},
+        "messages.json": {"messages": messages},
+        "sessions.json": {"sessions": sessions},
+        "inbox.json": {"inbox": inbox},
+    }
+    for name, payload in files.items():
+        (data_dir / name).write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    return {"users": users, "teams": teams, "days": days, "anchor": anchor.isoformat(), "records": len(records),
+            "schedules": len(plans), "messages": len(messages)}
+
+
+def drop_caches(core):
+    cache = core._data_cache()
+    with cache["lock"]:
+        cache["entries"].clear()
+    core._session_cache()["entries"].clear()
+
+
+def cases(core, rnd: random.Random, calls: int, anchor: date = ANCHOR) -> dict:
+    """name -> (function, argument tuples); arguments are sampled once so every run sees the same."""
+    users = sorted(core.load_users()["users"].values(), key=lambda u: u["email"])
+    emails = [u["email"] for u in users]
+    teams = sorted({u["team"] for u in users})
+    today = anchor
+    month_start = today.replace(day=1)
+    sessions = [f"bench-{emails.index(e)}" for e in emails]
+    pick = lambda seq: [rnd.choice(seq) for _ in range(calls)]
+    products = list(PRODUCT_WEIGHTS)
+    by_team = {t: [u for u in users if u["team"] == t] for t in teams}
+    return {
+        "get_bonus_for": (core.get_bonus_for, [(rnd.choice(products), (today - timedelta(days=rnd.randrange(720))).isoformat()) for _ in range(calls)]),
+        "aggregate_user_counts": (core.aggregate_user_counts, [(e, month_start, today) for e in pick(emails)]),
+        "sum_bonus_for_email_range": (core.sum_bonus_for_email_range, [(e, today - timedelta(days=90), today) for e in pick(emails)]),
+        "team_aggregate": (core.team_aggregate, [(t, month_start, today) for t in pick(teams)]),
+        "build_group_timeseries": (core.build_group_timeseries, [(by_team[t], "CUSTOM", today - timedelta(days=29), today) for t in pick(teams)]),
+        "eligible_messages_for_user": (core.eligible_messages_for_user, [(u,) for u in pick(users)]),
+        "get_user_by_session": (core.get_user_by_session, [(sid,) for sid in pick(sessions)]),
+    }
+
+
+def summary(samples: list) -> dict:
+    ordered = sorted(samples)
+    # nearest rank, so p90 never drops below the median on small samples
+    p90 = ordered[min(len(ordered) - 1, math.ceil(0.9 * len(ordered)) - 1)]
+    return {"median": statistics.median(ordered), "p90": p90, "min": ordered[0]}
+
+
+def child(calls: int, anchor: date = ANCHOR):
+    sys.path.insert(0, str(ROOT))
+    t0 = time.perf_counter()
+    import bezeq_bonus_core as core
+    result = {"import_s": time.perf_counter() - t0, "cases": {}}
+    reads = lambda: (core.storage_usage() or {}).get("reads", 0)
+    for name, (fn, arg_list) in cases(core, random.Random(1), calls, anchor).items():
+        uncached, cached, billed = [], [], []
+        for args in arg_list:
+            drop_caches(core)
+            r0, t0 = reads(), time.perf_counter()
+            fn(*args)
+            uncached.append(time.perf_counter() - t0)
+            billed.append(reads() - r0)
+            t0 = time.perf_counter()
+            fn(*args)
+            cached.append(time.perf_counter() - t0)
+        result["cases"][name] = {"uncached_s": summary(uncached), "cached_s": summary(cached)}
+        if core.storage_usage() is not None:
+            # Firestore document reads of one uncached call
+            result["cases"][name]["uncached_reads"] = summary(billed)
+    print(json.dumps(result))
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def anchor_mismatch(anchor: str, previous: dict) -> str | None:
+    if previous.get("anchor") != anchor:
+        return (f"cannot compare: {previous.get('commit') or 'the previous run'} measured data generated up to "
+                f"{previous.get('anchor') or 'its run date'}, this run up to {anchor}")
+    return None
+
+
+def compare(result: dict, previous: dict):
+    error = anchor_mismatch(result["anchor"], previous)
+    if error:
+        raise SystemExit(error)
+    print(f"median vs. {previous.get('commit') or 'previous run'} (new / old):", file=sys.stderr)
+    for scale, run in result["scales"].items():
+        old = previous.get("scales", {}).get(scale)
+        if not old:
+            continue
+        for name, case in run["cases"].items():
+            before = old["cases"].get(name)
+            if before:
+                ratios = [case[k]["median"] / before[k]["median"] if before[k]["median"] else float("nan") for k in ("uncached_s", "cached_s")]
+                print(f"  {scale:<7} {name:<28} uncached x{ratios[0]:.2f}  cached x{ratios[1]:.2f}", file=sys.stderr)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--scales", default=",".join(SCALES), help="comma-separated subset of " + ", ".join(SCALES))
+    ap.add_argument("--storage", choices=["json", "sqlite", "memory"], default="json",
+                    help="memory runs the Firestore code path against the in-memory stand-in and counts its reads")
+    ap.add_argument("--calls", type=int, default=20, help="sampled calls per case")
+    ap.add_argument("--out")
+    ap.add_argument("--compare", help="earlier results file to compare medians against")
+    ap.add_argument("--anchor", type=date.fromisoformat, default=ANCHOR, help="last day of the generated history (ISO date)")
+    ap.add_argument("--generate", metavar="DIR", help="only write a synthetic data directory and exit")
+    ap.add_argument("--users", type=int, default=100)
+    ap.add_argument("--days", type=int, default=365)
+    ap.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        child(args.calls, args.anchor)
+        return
+    if args.generate:
+        print(json.dumps(generate(Path(args.generate), args.users, args.days, anchor=args.anchor), indent=2))
+        return
+    previous = json.loads(Path(args.compare).read_text(encoding="utf-8")) if args.compare else None
+    # checked up front too, so a mismatch does not cost a full run first
+    error = anchor_mismatch(args.anchor.isoformat(), previous) if previous is not None else None
+    if error:
+        raise SystemExit(error)
+
+    env = {k: v for k, v in os.environ.items() if k not in ("BESELL_STORAGE", "BESELL_SQLITE_PATH", "FIREBASE_JSON", "GOOGLE_APPLICATION_CREDENTIALS")}
+    if args.storage != "json":
+        env["BESELL_STORAGE"] = args.storage
+    result = {"commit": git_commit(), "python": platform.python_version(), "storage": args.storage, "calls": args.calls,
+              "anchor": args.anchor.isoformat(), "scales": {}}
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in args.scales.split(","):
+            run_dir = Path(tmp) / scale
+            data = generate(run_dir / "data", **SCALES[scale], anchor=args.anchor)
+            print(f"{scale}: {data['users']} users, {data['records']} records", file=sys.stderr, flush=True)
+            out = subprocess.run([sys.executable, str(Path(__file__).resolve()), "--child", "--calls", str(args.calls),
+                                  "--anchor", args.anchor.isoformat()],
+                                 cwd=run_dir, env=env, capture_output=True, text=True, check=True)
+            result["scales"][scale] = {"data": data, **json.loads(out.stdout.strip().splitlines()[-1])}
+    text = json.dumps(result, indent=2)
+    if args.out:
+        Path(args.out).write_text(text + "\n", encoding="utf-8")
+    print(text)
+    if previous is not None:
+        compare(result, previous)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Cold start vs. warm rerun of the Streamlit page.
+
+    python benchmarks/startup.py [--app bezeq_bonus_app.py] [--cold-runs 3] [--reruns 10] [--out startup.json]
+
+Every cold sample is a fresh interpreter: imports, process initialization and the first
+render of a logged-in page. Warm samples are reruns of that same session, which is what
+each widget interaction costs. The app runs in local JSON mode against data seeded in a
+temporary directory and logs in through ?sid=.
+"""
+import argparse, json, math, os, random, statistics, subprocess, sys, tempfile, time
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SID = "bench-session"
+PRODUCT_CODES = ["fiber_new", "copper_new", "mesh_copper", "cyber_plus", "biznet_copper"]
+
+
+def p90(samples: list) -> float:
+    """Nearest-rank 90th percentile."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, math.ceil(0.9 * len(ordered)) - 1)]
+
+
+def seed(data_dir: Path, users: int = 20, days: int = 60):
+    rnd = random.Random(0)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    today = date.today()
+    accounts = {}
+    for i in range(users):
+        email = f"agent{i}@example.com"
+        accounts[email] = {"name": f"Agent {i}", "email": email, "team": str(i % 3 + 1), "invisible": False,
+                           "password": "pbkdf2$bench$0", "created_at": "2025-01-01T00:00:00+02:00",
+                           "goals": {"daily": 100, "weekly": 500, "monthly": 2000},
+                           "color": f"#{rnd.randrange(0x1000000):06x}", "is_admin": i == 0}
+    records = [{"email": email, "date": (today - timedelta(days=k)).isoformat(), "product": code,
+                "qty": rnd.randint(1, 3), "ts": (today - timedelta(days=k)).isoformat() + "T10:00:00+03:00"}
+               for email in accounts for k in range(days) for code in rnd.sample(PRODUCT_CODES, 2)]
+    (data_dir / "users.json").write_text(json.dumps({"users": accounts}), encoding="utf-8")
+    (data_dir / "records.json").write_text(json.dumps({"records": records}), encoding="utf-8")
+    (data_dir / "sessions.json").write_text(json.dumps({"sessions": {SID: {
+        "email": "agent0@example.com", "created_at": "2025-01-01T00:00:00+02:00",
+        "expires_at": "2099-01-01T00:00:00+02:00"}}}), encoding="utf-8")
+
+
+def child(app: str, reruns: int):
+    from streamlit.testing.v1 import AppTest
+    t0 = time.perf_counter()
+    at = AppTest.from_file(app, default_timeout=120)
+    at.query_params["sid"] = SID
+    at.run()
+    cold = time.perf_counter() - t0
+    if at.exception:
+        raise SystemExit(f"app raised: {at.exception[0].message}")
+    warm = []
+    for _ in range(reruns):
+        t0 = time.perf_counter()
+        at.run()
+        warm.append(time.perf_counter() - t0)
+    print(json.dumps({"cold": cold, "warm": warm}))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--app", default=str(ROOT / "bezeq_bonus_app.py"))
+    ap.add_argument("--cold-runs", type=int, default=3)
+    ap.add_argument("--reruns", type=int, default=10)
+    ap.add_argument("--out")
+    ap.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        child(args.app, args.reruns)
+        return
+
+    app = str(Path(args.app).resolve())
+    env = {k: v for k, v in os.environ.items() if k not in ("BESELL_STORAGE", "FIREBASE_JSON", "GOOGLE_APPLICATION_CREDENTIALS")}
+    cold, warm = [], []
+    with tempfile.TemporaryDirectory() as tmp:
+        for _ in range(args.cold_runs):
+            run_dir = Path(tempfile.mkdtemp(dir=tmp))
+            seed(run_dir / "data")
+            out = subprocess.run([sys.executable, str(Path(__file__).resolve()), "--child", "--app", app, "--reruns", str(args.reruns)],
+                                 cwd=run_dir, env=env, capture_output=True, text=True, check=True)
+            sample = json.loads(out.stdout.strip().splitlines()[-1])
+            cold.append(sample["cold"])
+            warm.extend(sample["warm"])
+    result = {
+        "app": os.path.relpath(app, ROOT) if app.startswith(str(ROOT)) else app,
+        "cold_start_s": {"median": statistics.median(cold), "min": min(cold), "samples": cold},
+        "warm_rerun_s": {"median": statistics.median(warm), "p90": p90(warm) if warm else None,
+                         "min": min(warm) if warm else None},
+    }
+    text = json.dumps(result, indent=2)
+    if args.out:
+        Path(args.out).write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2929 @@
+# bezeq_bonus_core — data layer and calculations behind bezeq_bonus_app.py.
+# Imported once per server process: storage, the product catalog and the compiled bonus
+# index are initialized at import time, so Streamlit reruns of the page script only pay
+# for the widgets they draw.
+# -*- coding: utf-8 -*-
+import json, random, uuid, os, tempfile, bisect, threading, copy, sqlite3, time, csv, io, zlib
+from functools import lru_cache, wraps
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date, timedelta
+from zoneinfo import ZoneInfo
+from pathlib import Path
+
+import streamlit as st
+import pandas as pd
+
+try:
+    import bcrypt
+except ImportError:
+    # hash_password/check_password fall back to PBKDF2
+    bcrypt = None
+
+FIREBASE_ENABLED = False
+SQLITE_ENABLED = False
+DB = None
+FS_MODULE = None  # firebase_admin.firestore, or bezeq_bonus_memstore in memory mode (Increment, transactional)
+FIREBASE_DIAG = {"ok": False, "error": "not-initialized", "source": None, "project_id": None}
+
+def _storage_backend_setting() -> str:
+    """'sqlite' selects the embedded database and 'memory' the in-memory Firestore stand-in;
+    anything else keeps Firestore -> JSON fallback."""
+    try:
+        if "STORAGE" in st.secrets:
+            return str(st.secrets["STORAGE"].get("backend", "")).strip().lower()
+    except Exception:
+        pass
+    return os.environ.get("BESELL_STORAGE", "").strip().lower()
+
+def init_firebase():
+    global FIREBASE_ENABLED, DB, FS_MODULE, FIREBASE_DIAG
+    try:
+        import firebase_admin
+        from firebase_admin import credentials, firestore
+        if not firebase_admin._apps:
+            cred_dict = None
+            try:
+                if "FIREBASE" in st.secrets:
+                    cred_dict = dict(st.secrets["FIREBASE"])
+            except Exception:
+                pass
+            if cred_dict is None:
+                fj = os.environ.get("FIREBASE_JSON")
+                if fj:
+                    try:
+                        cred_dict = json.loads(fj)
+                    except Exception:
+                        pass
+            if cred_dict is not None:
+                cred = credentials.Certificate(cred_dict)
+                FIREBASE_DIAG["source"] = "st.secrets[FIREBASE]"
+                firebase_admin.initialize_app(cred)
+            else:
+                gac = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
+                if gac and Path(gac).exists():
+                    cred = credentials.Certificate(gac)
+                    FIREBASE_DIAG["source"] = "GOOGLE_APPLICATION_CREDENTIALS"
+                    firebase_admin.initialize_app(cred)
+                else:
+                    local = Path("firebase_service_account.json")
+                    if local.exists():
+                        cred = credentials.Certificate(str(local))
+                        FIREBASE_DIAG["source"] = "firebase_service_account.json file"
+                        firebase_admin.initialize_app(cred)
+        from firebase_admin import firestore
+        DB = firestore.client()
+        FS_MODULE = firestore
+        FIREBASE_ENABLED = True
+        try:
+            FIREBASE_DIAG = {"ok": True, "error": None, "source": FIREBASE_DIAG.get("source"), "project_id": st.secrets.get("FIREBASE",{}).get("project_id") if "FIREBASE" in st.secrets else None}
+        except Exception:
+            FIREBASE_DIAG = {"ok": True, "error": None, "source": FIREBASE_DIAG.get("source"), "project_id": None}
+    except Exception as e:
+        FIREBASE_ENABLED = False
+        DB = None
+        FIREBASE_DIAG = {"ok": False, "error": str(e), "source": FIREBASE_DIAG.get("source"), "project_id": None}
+
+APP_TZ = ZoneInfo("Asia/Jerusalem")
+DATA_DIR = Path("data")
+USERS_PATH = DATA_DIR / "users.json"
+RECORDS_PATH = DATA_DIR / "records.json"
+RECORDS_LOG_PATH = DATA_DIR / "records.log.jsonl"
+RECORDS_LOG_COMPACT_EVENTS = 500
+BONUSES_PATH = DATA_DIR / "bonuses.json"
+MSGS_PATH = DATA_DIR / "messages.json"
+SESSIONS_PATH = DATA_DIR / "sessions.json"
+INBOX_PATH = DATA_DIR / "inbox.json"
+SESSION_CACHE_TTL = 60  # seconds a validated sid is trusted without a storage read
+SQLITE_PATH = Path(os.environ.get("BESELL_SQLITE_PATH") or (DATA_DIR / "besell.db"))
+
+PRODUCTS = [
+    {"code": "fiber_new", "name": "אינטרנט סיבים חדש", "bonus": 23},
+    {"code": "copper_new", "name": "אינטרנט נחושת חדש", "bonus": 10},
+    {"code": "mesh_copper", "name": "מגדיל טווח MESH בנחושת", "bonus": 5},
+    {"code": "bspot_copper", "name": "מגדיל טווח BSPOT בנחושת", "bonus": 10},
+    {"code": "mesh_fiber", "name": "מגדיל טווח MESH FIBER בסיבים", "bonus": 10},
+    {"code": "upgrade_fiber_to_fiber", "name": "שדרוג מסיב לסיב", "bonus": 8},
+    {"code": "cyber_plus", "name": "סייבר+", "bonus": 10},
+    {"code": "biznet_copper", "name": "ביזנט בנחושת", "bonus": 43},
+    {"code": "bizfiber_fiber", "name": "ביזפייבר בסיבים האופטיים", "bonus": 73},
+    {"code": "upgrade_biznet_to_bizfiber", "name": "שדרוג מביזנט (נחושת) לביזפייבר (סיבים)", "bonus": 20},
+]
+PRODUCT_INDEX = {p["code"]: p for p in PRODUCTS}
+
+def ensure_files():
+    DATA_DIR.mkdir(exist_ok=True)
+    if not USERS_PATH.exists():
+        USERS_PATH.write_text(json.dumps({"users": {}}, ensure_ascii=False, indent=2), encoding="utf-8")
+    if not RECORDS_PATH.exists():
+        RECORDS_PATH.write_text(json.dumps({"records": []}, ensure_ascii=False, indent=2), encoding="utf-8")
+    if not BONUSES_PATH.exists():
+        base_prices = {p["code"]: int(p["bonus"]) for p in PRODUCTS}
+        BONUSES_PATH.write_text(json.dumps({
+            "products": PRODUCTS,
+            "schedules": [
+                {"effective_date": "1970-01-01", "prices": base_prices}
+            ]
+        }, ensure_ascii=False, indent=2), encoding="utf-8")
+    if not MSGS_PATH.exists():
+        MSGS_PATH.write_text(json.dumps({"messages": []}, ensure_ascii=False, indent=2), encoding="utf-8")
+    if not SESSIONS_PATH.exists():
+        SESSIONS_PATH.write_text(json.dumps({"sessions": {}}, ensure_ascii=False, indent=2), encoding="utf-8")
+    if not INBOX_PATH.exists():
+        INBOX_PATH.write_text(json.dumps({"inbox": {}}, ensure_ascii=False, indent=2), encoding="utf-8")
+
+def _fs_users_load():
+    assert FIREBASE_ENABLED and DB
+    live = _live_get("users")
+    docs = live.items() if live is not None else ((d.id, d.to_dict()) for d in DB.collection("users").stream())
+    users = {}
+    for doc_id, data in docs:
+        u = dict(data or {})
+        if "email" not in u:
+            u["email"] = doc_id
+        users[u["email"].lower()] = u
+    return {"users": users}
+
+# --- Bulk writes (Firestore) ---
+# Mass saves go through _fs_bulk_write: operations are cut into batches below Firestore's
+# 500-writes-per-commit limit and committed concurrently on a small thread pool, each
+# batch retried with exponential backoff. A batch is atomic, so a retry never half-applies
+# it; there is no ordering between batches. The last run's throughput shows in Diagnostics.
+FS_BATCH_OPS = 450
+FS_BULK_WORKERS = 8
+FS_BULK_RETRIES = 5
+
+@st.cache_resource(show_spinner=False)
+def _bulk_write_stats():
+    return {"last": None}
+
+def _fs_bulk_chunks(ops):
+    chunk = []
+    for op in ops:
+        group = op if isinstance(op, list) else [op]
+        if chunk and len(chunk) + len(group) > FS_BATCH_OPS:
+            yield chunk
+            chunk = []
+        chunk.extend(group)
+    if chunk:
+        yield chunk
+
+def _fs_commit_chunk(chunk: list) -> int:
+    """Commit one batch, retrying with backoff; returns how many retries it took."""
+    for attempt in range(FS_BULK_RETRIES + 1):
+        batch = DB.batch()
+        for kind, ref, data in chunk:
+            if kind == "delete":
+                batch.delete(ref)
+            else:
+                batch.set(ref, data, merge=(kind == "merge"))
+        try:
+            batch.commit()
+            return attempt
+        except Exception:
+            if attempt == FS_BULK_RETRIES:
+                raise
+            time.sleep(min(8.0, 0.25 * 2 ** attempt) * (0.5 + random.random()))
+
+def _fs_bulk_write(ops, workers: int = FS_BULK_WORKERS, on_batch=None) -> dict:
+    """Commit ("set" | "merge" | "delete", ref, data) operations in chunked, parallel batches.
+
+    A list of operations in `ops` always lands in a single batch. `on_batch(done, total)` is
+    called as batches finish. The first error that outlives its retries is raised once the
+    other batches are done; otherwise the run's throughput stats are returned."""
+    assert FIREBASE_ENABLED and DB
+    t0 = time.perf_counter()
+    chunks = list(_fs_bulk_chunks(ops))
+    retries, error = 0, None
+    if chunks:
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(chunks)))) as pool:
+            futures = [pool.submit(_fs_commit_chunk, chunk) for chunk in chunks]
+            for done, fut in enumerate(futures, 1):
+                try:
+                    retries += fut.result()
+                except Exception as e:
+                    error = error or e
+                if on_batch:
+                    on_batch(done, len(chunks))
+    seconds = time.perf_counter() - t0
+    n_ops = sum(len(chunk) for chunk in chunks)
+    stats = {"ops": n_ops, "batches": len(chunks), "retries": retries, "seconds": round(seconds, 3),
+             "ops_per_s": round(n_ops / seconds, 1) if seconds > 0 else None, "failed": error is not None}
+    if chunks:
+        _bulk_write_stats()["last"] = stats
+    if error is not None:
+        raise error
+    return stats
+
+def _fs_users_save(data: dict):
+    assert FIREBASE_ENABLED and DB
+    col = DB.collection("users")
+    _fs_bulk_write([("merge", col.document(email), {**u, "email": email}) for email, u in data.get("users", {}).items()])
+
+def _fs_records_load():
+    assert FIREBASE_ENABLED and DB
+    docs = DB.collection("records").stream()
+    rows = []
+    for d in docs:
+        r = d.to_dict() or {}
+        if {"email","date","product","qty","ts"} <= set(r.keys()):
+            rows.append(r)
+    return {"records": rows}
+
+def _fs_records_replace_all(data: dict):
+    assert FIREBASE_ENABLED and DB
+    # duplicates of a (user, day, product) fold into its single keyed document
+    merged = {}
+    for r in data.get("records", []):
+        rid = r.get("id") or _record_id(r["email"], r["date"], r["product"])
+        if rid in merged and not r.get("id"):
+            merged[rid] = {**r, "qty": int(merged[rid]["qty"]) + int(r["qty"])}
+        else:
+            merged[rid] = r
+    col = DB.collection("records")
+    _fs_bulk_write([("merge", col.document(rid), r) for rid, r in merged.items()])
+    # bulk rewrites bypass the per-day rollups; fall back to raw reads until they are rebuilt
+    _set_rollups_ready(False)
+
+def _record_id(email: str, date_s: str, product: str) -> str:
+    # one document per user, day and product: saving a day overwrites instead of querying
+    return f"{email}|{date_s}|{product}"
+
+def _fs_day_previous(transaction, email: str, date_s: str, rollup_ref) -> tuple:
+    """(per-product counts, legacy record refs) a user-day held, read inside `transaction`.
+
+    A `keyed` rollup lists exactly the day's deterministic records, so no query is needed.
+    Days saved before record ids were deterministic may still hold random-id documents;
+    those are queried once (unless rollups are ready and the day has none) and replaced."""
+    snap = rollup_ref.get(transaction=transaction)
+    r = (snap.to_dict() or {}) if snap.exists else None
+    if r is not None and r.get("keyed"):
+        return {code: int(qty) for code, qty in (r.get("products") or {}).items()}, []
+    if r is None and _rollups_ready():
+        return {}, []
+    old, legacy = {}, []
+    q = DB.collection("records").where("email", "==", email).where("date", "==", date_s)
+    for d in q.stream(transaction=transaction):
+        rec = d.to_dict() or {}
+        old[rec.get("product", "")] = old.get(rec.get("product", ""), 0) + int(rec.get("qty", 0))
+        if d.id != _record_id(email, date_s, rec.get("product", "")):
+            legacy.append(d.reference)
+    return old, legacy
+
+# --- Daily rollups (Firestore) ---
+# add_or_set_counts keeps one daily_rollups/{email}|{date} document per user-day in the same
+# batch as the raw records: per-product quantities plus the bonus at the day's prices,
+# stamped with the bonus-config version used. Range reads fetch one document per day
+# instead of one per product. They are used once config/rollups.ready is set by
+# rebuild_daily_rollups(), which backfills history written before rollups existed. The
+# flag is re-read only when the data version moves, like the other cached reads.
+@st.cache_resource(show_spinner=False)
+def _rollup_state():
+    return {"ready": None, "checked": None}
+
+def _rollup_id(email: str, date_s: str) -> str:
+    return f"{email}|{date_s}"
+
+def _day_rollup(email: str, date_s: str, counts: dict, ts: str) -> dict:
+    products = {code: int(qty) for code, qty in counts.items() if int(qty) > 0}
+    return {
+        "email": email,
+        "date": date_s,
+        "products": products,
+        "items": sum(products.values()),
+        "bonus": sum(qty * get_bonus_for(code, date_s) for code, qty in products.items()),
+        "bonus_version": _bonus_index()["version"],
+        "ts": ts,
+    }
+
+def _rollup_bonus(r: dict) -> int:
+    # the stored bonus is only trusted while the price schedules it was computed with are current
+    if "bonus" in r and r.get("bonus_version") == _bonus_index()["version"]:
+        return int(r["bonus"])
+    return sum(int(qty) * get_bonus_for(code, r["date"]) for code, qty in (r.get("products") or {}).items())
+
+def _rollups_ready() -> bool:
+    if not FIREBASE_ENABLED:
+        return False
+    state, seen = _rollup_state(), _data_version()
+    if state["ready"] is None or state["checked"] != seen:
+        try:
+            doc = DB.collection("config").document("rollups").get()
+            state["ready"] = bool(doc.exists and (doc.to_dict() or {}).get("ready"))
+        except Exception:
+            state["ready"] = False
+        state["checked"] = seen
+    return state["ready"]
+
+def _set_rollups_ready(ready: bool):
+    DB.collection("config").document("rollups").set({"ready": bool(ready), "updated_at": now_ij().isoformat()}, merge=True)
+    _bump_data_version()  # other processes re-read the flag on their next version poll
+    _rollup_state().update(ready=bool(ready), checked=_data_version())
+
+def _fs_rollups_range(emails: list, s: str, e: str):
+    """Rollup dicts for the given users between s and e (inclusive ISO dates)."""
+    col = DB.collection("daily_rollups")
+    wanted = set(emails)
+    if len(wanted) == 1:
+        q = col.where("email", "==", next(iter(wanted)))
+    elif len(wanted) <= 30:
+        q = col.where("email", "in", sorted(wanted))
+    else:
+        q = col
+    for d in q.where("date", ">=", s).where("date", "<=", e).stream():
+        r = d.to_dict() or {}
+        if r.get("email") in wanted:
+            yield r
+
+def rebuild_daily_rollups() -> int:
+    """Recompute every daily rollup from the raw records and mark rollups as ready."""
+    assert FIREBASE_ENABLED and DB
+    days = {}
+    for d in DB.collection("records").stream():
+        r = d.to_dict() or {}
+        if not {"email", "date", "product", "qty"} <= set(r):
+            continue
+        day = days.setdefault((r["email"], r["date"]), {"counts": {}, "ts": "", "keyed": True})
+        day["counts"][r["product"]] = day["counts"].get(r["product"], 0) + int(r["qty"])
+        day["ts"] = max(day["ts"], r.get("ts", "") or "")
+        day["keyed"] = day["keyed"] and d.id == _record_id(r["email"], r["date"], r["product"])
+    col = DB.collection("daily_rollups")
+    stale = [d.reference for d in col.stream() if tuple(d.id.rsplit("|", 1)) not in days]
+    ops = [("set", col.document(_rollup_id(em, ds)), {**_day_rollup(em, ds, v["counts"], v["ts"]), "keyed": v["keyed"]})
+           for (em, ds), v in days.items()]
+    ops += [("delete", ref, None) for ref in stale]
+    _fs_bulk_write(ops)
+    _set_rollups_ready(True)
+    return len(days)
+
+def _fs_bonus_load():
+    assert FIREBASE_ENABLED and DB
+    data = _live_get("bonuses")
+    if data is None:
+        doc = DB.collection("config").document("bonuses").get()
+        data = (doc.to_dict() or {}) if doc.exists else {}
+    if "schedules" in data:
+        return {"schedules": copy.deepcopy(list(data["schedules"])), "version": int(data.get("version", 0) or 0)}
+    base_prices = {p["code"]: int(p["bonus"]) for p in PRODUCTS}
+    return {"schedules": [{"effective_date": "1970-01-01", "prices": base_prices}]}
+
+def _fs_messages_load():
+    assert FIREBASE_ENABLED and DB
+    live = _live_get("messages")
+    if live is not None:
+        docs = sorted(live.items(), key=lambda kv: (kv[1] or {}).get("created_at") or "")
+    else:
+        docs = ((d.id, d.to_dict()) for d in DB.collection("messages").order_by("created_at").stream())
+    msgs = []
+    for doc_id, data in docs:
+        m = dict(data or {})
+        if "id" not in m:
+            m["id"] = doc_id
+        msgs.append(m)
+    return {"messages": msgs}
+
+def _fs_messages_save(data: dict):
+    assert FIREBASE_ENABLED and DB
+    col = DB.collection("messages")
+    ops = []
+    for m in data.get("messages", []):
+        mid = m.get("id") or str(uuid.uuid4())
+        ops.append(("merge", col.document(mid), {**m, "id": mid}))
+    _fs_bulk_write(ops)
+
+# --- Firestore live cache ---
+# users, messages and config/bonuses are small and read on nearly every rerun, so in
+# Firestore mode one set of on_snapshot listeners per server process mirrors them in
+# memory and applies each change delta as it arrives. Loaders use the mirror once the
+# first snapshot has landed. A collection this process has just written is read from
+# Firestore until its listener catches up (at most LIVE_STALE_GRACE seconds), so a
+# session always sees its own writes. Mirrored documents are shared: treat them as read-only.
+LIVE_STALE_GRACE = 5
+
+@st.cache_resource(show_spinner=False)
+def _live_cache():
+    return {"users": {}, "messages": {}, "bonuses": {}, "ready": set(), "stale": {},
+            "watches": None, "error": None, "lock": threading.RLock()}
+
+def _live_collection_handler(name: str):
+    def on_snapshot(docs, changes, read_time):
+        live = _live_cache()
+        with live["lock"]:
+            mirror = dict(live[name])
+            for change in changes:
+                if change.type.name == "REMOVED":
+                    mirror.pop(change.document.id, None)
+                else:
+                    mirror[change.document.id] = change.document.to_dict() or {}
+            live[name] = mirror
+            live["ready"].add(name)
+            live["stale"].pop(name, None)
+        _invalidate_data_cache()
+    return on_snapshot
+
+def _live_bonuses_handler(docs, changes, read_time):
+    live = _live_cache()
+    with live["lock"]:
+        snap = docs[0] if docs else None
+        data = (snap.to_dict() or {}) if snap is not None and snap.exists else {}
+        live["bonuses"] = data
+        live["ready"].add("bonuses")
+        live["stale"].pop("bonuses", None)
+    version, idx = int(data.get("version", 0) or 0), _bonus_index_holder()["index"]
+    if "schedules" in data and (idx is None or version > idx["version"]):
+        # prices saved by any process take effect here without waiting for a version poll
+        _publish_bonus_index(data["schedules"], version)
+    _invalidate_data_cache()
+
+def _live_start():
+    """Attach the listeners once per server process."""
+    live = _live_cache()
+    if live["watches"] is not None or not (FIREBASE_ENABLED and DB):
+        return
+    with live["lock"]:
+        if live["watches"] is not None:
+            return
+        live["watches"] = []
+        try:
+            live["watches"].append(DB.collection("users").on_snapshot(_live_collection_handler("users")))
+            live["watches"].append(DB.collection("messages").on_snapshot(_live_collection_handler("messages")))
+            live["watches"].append(DB.collection("config").document("bonuses").on_snapshot(_live_bonuses_handler))
+        except Exception as e:
+            # without listeners every loader simply keeps reading Firestore directly
+            live["error"] = str(e)
+
+def _live_get(name: str, shared: bool = False):
+    """The in-memory mirror of `name`, or None when Firestore has to be read instead.
+
+    With `shared` the mirror object itself is returned; it is replaced (never mutated) on
+    every change, so its identity tells whether anything changed."""
+    _live_start()
+    live = _live_cache()
+    with live["lock"]:
+        if name not in live["ready"] or live["stale"].get(name, 0) > time.monotonic():
+            return None
+        return live[name] if shared else dict(live[name])
+
+def _live_reset():
+    """Detach the listeners and forget the mirror, e.g. when DB is replaced."""
+    live = _live_cache()
+    with live["lock"]:
+        for watch in live["watches"] or []:
+            try:
+                watch.unsubscribe()
+            except Exception:
+                pass
+        live.update(users={}, messages={}, bonuses={}, ready=set(), stale={}, watches=None, error=None)
+
+def _live_mark_stale(*names: str):
+    live = _live_cache()
+    with live["lock"]:
+        for name in names:
+            live["stale"][name] = time.monotonic() + LIVE_STALE_GRACE
+
+# --- SQLite backend (single-node alternative to Firestore) ---
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    email TEXT PRIMARY KEY,
+    session_sid TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_users_session_sid ON users(session_sid);
+CREATE TABLE IF NOT EXISTS records (
+    email TEXT NOT NULL,
+    date TEXT NOT NULL,
+    product TEXT NOT NULL,
+    qty INTEGER NOT NULL,
+    ts TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (email, date, product)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_records_date_email ON records(date, email);
+CREATE TABLE IF NOT EXISTS config (
+    key TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS messages (
+    id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_messages_created_at ON messages(created_at);
+CREATE TABLE IF NOT EXISTS message_targets (
+    kind TEXT NOT NULL,
+    target TEXT NOT NULL,
+    message_id TEXT NOT NULL,
+    PRIMARY KEY (kind, target, message_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_message_targets_message ON message_targets(message_id);
+CREATE TABLE IF NOT EXISTS message_receipts (
+    email TEXT NOT NULL,
+    message_id TEXT NOT NULL,
+    dismissed_at TEXT NOT NULL,
+    PRIMARY KEY (email, message_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_message_receipts_message ON message_receipts(message_id);
+CREATE TABLE IF NOT EXISTS sessions (
+    sid TEXT PRIMARY KEY,
+    email TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    expires_at TEXT NOT NULL,
+    expires_epoch REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_email ON sessions(email);
+CREATE TABLE IF NOT EXISTS leaderboards (
+    period TEXT NOT NULL,
+    email TEXT NOT NULL,
+    bonus INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (period, email)
+);
+"""
+
+@st.cache_resource(show_spinner=False)
+def _sqlite_handle(path: str):
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_SQLITE_SCHEMA)
+    return {"conn": conn, "lock": threading.RLock()}
+
+class _SqlSession:
+    """Serialized access to the shared connection; commits on success, rolls back on error."""
+    def __enter__(self):
+        self.h = _sqlite_handle(os.path.abspath(SQLITE_PATH))
+        self.h["lock"].acquire()
+        return self.h["conn"]
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.h["conn"].commit()
+            else:
+                self.h["conn"].rollback()
+        finally:
+            self.h["lock"].release()
+        return False
+
+def init_sqlite():
+    global SQLITE_ENABLED, FIREBASE_DIAG
+    try:
+        SQLITE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fresh = not SQLITE_PATH.exists()
+        _sqlite_handle(os.path.abspath(SQLITE_PATH))
+        if fresh:
+            _sql_import_json_files()
+        else:
+            _sql_message_targets_backfill()
+        SQLITE_ENABLED = True
+        FIREBASE_DIAG = {"ok": False, "error": None, "source": "sqlite", "project_id": None, "sqlite_path": str(SQLITE_PATH)}
+    except Exception as e:
+        SQLITE_ENABLED = False
+        FIREBASE_DIAG = {"ok": False, "error": f"sqlite: {e}", "source": "sqlite", "project_id": None}
+
+def _sql_import_json_files():
+    # first start on SQLite: carry over whatever the local JSON files hold
+    users = load_users().get("users", {})
+    records = load_records().get("records", [])
+    cfg = load_bonus_config()
+    msgs = load_messages().get("messages", [])
+    _sql_users_save({"users": users})
+    _sql_records_replace_all({"records": records})
+    _sql_config_save("bonuses", {"schedules": cfg.get("schedules", []), "products": cfg.get("products", []), "version": int(cfg.get("version", 0) or 0)})
+    _sql_messages_save({"messages": msgs})
+    with _SqlSession() as conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO sessions(sid, email, created_at, expires_at, expires_epoch) VALUES (?, ?, ?, ?, ?)",
+            [(sid, v["email"], v.get("created_at", ""), v["expires_at"], datetime.fromisoformat(v["expires_at"]).timestamp())
+             for sid, v in _json_sessions().items() if not _session_expired(v.get("expires_at", ""))],
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO message_receipts(email, message_id, dismissed_at) VALUES (?, ?, ?)",
+            [(email, mid, ts) for email, seen in _json_inbox().items() for mid, ts in seen.items()],
+        )
+
+def _sql_users_load():
+    with _SqlSession() as conn:
+        rows = conn.execute("SELECT email, data FROM users").fetchall()
+    users = {}
+    for email, blob in rows:
+        u = json.loads(blob)
+        u.setdefault("email", email)
+        users[email] = u
+    return {"users": users}
+
+def _sql_users_save(data: dict):
+    users = data.get("users", {})
+    with _SqlSession() as conn:
+        conn.execute("DELETE FROM users")
+        conn.executemany(
+            "INSERT INTO users(email, session_sid, data) VALUES (?, ?, ?)",
+            [(email, u.get("session_sid"), json.dumps({**u, "email": email}, ensure_ascii=False)) for email, u in users.items()],
+        )
+
+def _sql_user_get(email: str):
+    with _SqlSession() as conn:
+        row = conn.execute("SELECT data FROM users WHERE email = ?", (email,)).fetchone()
+    if not row:
+        return None
+    u = json.loads(row[0])
+    u.setdefault("email", email)
+    return u
+
+def _sql_user_update(email: str, fields: dict, drop: tuple = (), create: bool = False) -> bool:
+    """Merge `fields` into one user row (and remove `drop` keys); False if the user is missing."""
+    with _SqlSession() as conn:
+        row = conn.execute("SELECT data FROM users WHERE email = ?", (email,)).fetchone()
+        if row is None and not create:
+            return False
+        u = json.loads(row[0]) if row else {}
+        u.update(fields)
+        for k in drop:
+            u.pop(k, None)
+        u["email"] = email
+        conn.execute(
+            "INSERT INTO users(email, session_sid, data) VALUES (?, ?, ?) "
+            "ON CONFLICT(email) DO UPDATE SET session_sid = excluded.session_sid, data = excluded.data",
+            (email, u.get("session_sid"), json.dumps(u, ensure_ascii=False)),
+        )
+    return True
+
+def _sql_records_load():
+    with _SqlSession() as conn:
+        rows = conn.execute("SELECT email, date, product, qty, ts FROM records").fetchall()
+    return {"records": [{"email": e, "date": d, "product": p, "qty": q, "ts": t} for e, d, p, q, t in rows]}
+
+def _sql_records_replace_all(data: dict):
+    recs = data.get("records", [])
+    with _SqlSession() as conn:
+        conn.execute("DELETE FROM records")
+        # duplicate (email, date, product) rows are summed, like the readers always did
+        conn.executemany(
+            "INSERT INTO records(email, date, product, qty, ts) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(email, date, product) DO UPDATE SET qty = qty + excluded.qty, ts = max(ts, excluded.ts)",
+            [(r["email"], r["date"], r["product"], int(r["qty"]), r.get("ts", "")) for r in recs],
+        )
+
+def _sql_records_set_day(email: str, date_s: str, counts: dict, ts: str):
+    with _SqlSession() as conn:
+        old = dict(conn.execute("SELECT product, qty FROM records WHERE email = ? AND date = ?", (email, date_s)).fetchall())
+        deltas = _leaderboard_deltas(date_s, old, counts)
+        conn.execute("DELETE FROM records WHERE email = ? AND date = ?", (email, date_s))
+        conn.executemany(
+            "INSERT INTO records(email, date, product, qty, ts) VALUES (?, ?, ?, ?, ?)",
+            [(email, date_s, code, int(qty), ts) for code, qty in counts.items() if int(qty) > 0],
+        )
+        conn.executemany(
+            "INSERT INTO leaderboards(period, email, bonus) VALUES (?, ?, ?) "
+            "ON CONFLICT(period, email) DO UPDATE SET bonus = bonus + excluded.bonus",
+            [(key, email, delta) for key, delta in deltas.items()],
+        )
+        _sql_leaderboards_touch(conn, deltas)
+
+def _sql_product_totals(email: str, s: str, e: str) -> dict:
+    with _SqlSession() as conn:
+        rows = conn.execute(
+            "SELECT product, SUM(qty) FROM records WHERE email = ? AND date BETWEEN ? AND ? GROUP BY product",
+            (email, s, e),
+        ).fetchall()
+    return {p: int(q) for p, q in rows}
+
+def _sql_day_product_totals(email: str, s: str, e: str) -> list:
+    with _SqlSession() as conn:
+        return conn.execute(
+            "SELECT date, product, SUM(qty) FROM records WHERE email = ? AND date BETWEEN ? AND ? GROUP BY date, product",
+            (email, s, e),
+        ).fetchall()
+
+def _sql_records_between(s: str, e: str, email: str | None = None) -> list:
+    sql = "SELECT email, date, product, qty, ts FROM records WHERE date BETWEEN ? AND ?"
+    args = [s, e]
+    if email is not None:
+        sql += " AND email = ?"
+        args.append(email)
+    with _SqlSession() as conn:
+        rows = conn.execute(sql, args).fetchall()
+    return [{"email": em, "date": d, "product": p, "qty": q, "ts": t} for em, d, p, q, t in rows]
+
+def _sql_config_load(key: str):
+    with _SqlSession() as conn:
+        row = conn.execute("SELECT data FROM config WHERE key = ?", (key,)).fetchone()
+    return json.loads(row[0]) if row else None
+
+def _sql_config_save(key: str, data: dict):
+    # same merge semantics as the Firestore config document
+    with _SqlSession() as conn:
+        row = conn.execute("SELECT data FROM config WHERE key = ?", (key,)).fetchone()
+        merged = {**(json.loads(row[0]) if row else {}), **data}
+        conn.execute(
+            "INSERT INTO config(key, data) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET data = excluded.data",
+            (key, json.dumps(merged, ensure_ascii=False)),
+        )
+
+def _sql_bonus_load():
+    data = _sql_config_load("bonuses") or {}
+    if "schedules" in data:
+        return {"schedules": list(data["schedules"]), "version": int(data.get("version", 0) or 0)}
+    base_prices = {p["code"]: int(p["bonus"]) for p in PRODUCTS}
+    return {"schedules": [{"effective_date": "1970-01-01", "prices": base_prices}]}
+
+def _sql_messages_load():
+    with _SqlSession() as conn:
+        rows = conn.execute("SELECT id, data FROM messages ORDER BY created_at").fetchall()
+    msgs = []
+    for mid, blob in rows:
+        m = json.loads(blob)
+        m.setdefault("id", mid)
+        msgs.append(m)
+    return {"messages": msgs}
+
+def _sql_message_put(m: dict):
+    with _SqlSession() as conn:
+        conn.execute(
+            "INSERT INTO messages(id, created_at, data) VALUES (?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET created_at = excluded.created_at, data = excluded.data",
+            (m["id"], m.get("created_at", ""), json.dumps(m, ensure_ascii=False)),
+        )
+        _sql_message_targets_sync(conn, m)
+
+def _sql_message_targets_sync(conn, m: dict):
+    conn.execute("DELETE FROM message_targets WHERE message_id = ?", (m["id"],))
+    conn.executemany("INSERT OR IGNORE INTO message_targets(kind, target, message_id) VALUES (?, ?, ?)",
+                     [(kind, target, m["id"]) for kind, target in _message_targets(m)])
+
+def _sql_message_targets_backfill():
+    # databases created before message_targets existed
+    with _SqlSession() as conn:
+        if conn.execute("SELECT 1 FROM message_targets LIMIT 1").fetchone():
+            return
+        for mid, blob in conn.execute("SELECT id, data FROM messages").fetchall():
+            _sql_message_targets_sync(conn, {**json.loads(blob), "id": mid})
+
+def _sql_messages_for(email: str, team: str) -> list:
+    with _SqlSession() as conn:
+        rows = conn.execute(
+            "SELECT id, data FROM messages WHERE id IN (SELECT message_id FROM message_targets "
+            "WHERE kind = 'all' OR (kind = 'team' AND target = ?) OR (kind = 'email' AND target = ?))",
+            (team or "", email),
+        ).fetchall()
+    return [{**json.loads(blob), "id": mid} for mid, blob in rows]
+
+def _sql_message_merge(msg_id: str, mutate) -> bool:
+    """Read-modify-write one message inside a single transaction."""
+    with _SqlSession() as conn:
+        row = conn.execute("SELECT data FROM messages WHERE id = ?", (msg_id,)).fetchone()
+        if row is None:
+            return False
+        m = json.loads(row[0])
+        mutate(m)
+        conn.execute("UPDATE messages SET data = ? WHERE id = ?", (json.dumps(m, ensure_ascii=False), msg_id))
+        _sql_message_targets_sync(conn, {**m, "id": msg_id})
+    return True
+
+def _sql_messages_save(data: dict):
+    msgs = data.get("messages", [])
+    with _SqlSession() as conn:
+        conn.execute("DELETE FROM messages")
+        conn.execute("DELETE FROM message_targets")
+        for m in msgs:
+            mid = m.get("id") or str(uuid.uuid4())
+            m2 = dict(m); m2["id"] = mid
+            conn.execute("INSERT OR REPLACE INTO messages(id, created_at, data) VALUES (?, ?, ?)",
+                         (mid, m2.get("created_at", ""), json.dumps(m2, ensure_ascii=False)))
+            _sql_message_targets_sync(conn, m2)
+
+def _storage_reset():
+    """Back to the local JSON files with every per-process cache emptied, before switching backends."""
+    global FIREBASE_ENABLED, SQLITE_ENABLED
+    FIREBASE_ENABLED = SQLITE_ENABLED = False
+    _live_reset()
+    _session_cache()["entries"].clear()
+    store = _records_store()
+    with store["lock"]:
+        store.update(by_email=None, flat=None, stamp=None, log_pos=0, log_events=0)
+    holder = _bonus_index_holder()
+    with holder["lock"]:
+        holder["index"] = None
+    _invalidate_data_cache(repoll=True)
+
+def init_storage():
+    backend = _storage_backend_setting()
+    if backend == "sqlite":
+        init_sqlite()
+    elif backend == "memory":
+        init_memory()
+    else:
+        init_firebase()
+
+# --- Data cache ---
+# Reader results are memoized per process, keyed by function and arguments, bounded to
+# DATA_CACHE_MAX entries (LRU) and DATA_CACHE_TTL seconds. Each entry remembers the data
+# version it was computed at. Writers bump the version (a local generation plus the
+# `v` counter on config/version in Firestore), which retires every entry at once;
+# changes made by other processes are noticed by polling the storage stamp at most
+# every DATA_VERSION_POLL seconds. config/version is a single hot document, so it is
+# bumped at most once per logical operation (nested writers fold into the outermost)
+# and not at all for writes confined to the live-mirrored collections: there the
+# listeners already retire other processes' caches.
+DATA_CACHE_TTL = 300
+DATA_CACHE_MAX = 256
+DATA_VERSION_POLL = 2
+
+@st.cache_resource(show_spinner=False)
+def _data_cache():
+    return {"entries": OrderedDict(), "gen": 0, "backend": None, "remote": None, "polled": 0.0,
+            "hits": 0, "misses": 0, "lock": threading.Lock()}
+
+def _storage_stamp():
+    if FIREBASE_ENABLED:
+        snap = DB.collection("config").document("version").get()
+        return int((snap.to_dict() or {}).get("v", 0)) if snap.exists else 0
+    if SQLITE_ENABLED:
+        # changes whenever another connection (process) commits
+        with _SqlSession() as conn:
+            return conn.execute("PRAGMA data_version").fetchone()[0]
+    return tuple(_file_stamp(p) for p in (USERS_PATH, RECORDS_PATH, RECORDS_LOG_PATH, BONUSES_PATH, MSGS_PATH, INBOX_PATH))
+
+def _data_version():
+    cache = _data_cache()
+    now = time.monotonic()
+    backend = "firestore" if FIREBASE_ENABLED else "sqlite" if SQLITE_ENABLED else "json"
+    if cache["backend"] != backend or now - cache["polled"] > DATA_VERSION_POLL:
+        try:
+            cache["remote"] = _storage_stamp()
+        except Exception:
+            pass
+        cache["backend"], cache["polled"] = backend, now
+    return cache["gen"], backend, cache["remote"]
+
+def _invalidate_data_cache(repoll: bool = False):
+    cache = _data_cache()
+    with cache["lock"]:
+        cache["gen"] += 1
+        if repoll:
+            cache["polled"] = 0.0
+        cache["entries"].clear()
+
+_WRITE_SCOPE = threading.local()
+
+def _live_listening(names) -> bool:
+    live = _live_cache()
+    with live["lock"]:
+        return bool(live["watches"]) and live["error"] is None and set(names) <= live["ready"]
+
+def _bump_data_version(*touched: str, mirrored: bool = False):
+    """Called after every write; `touched` names the live-cached collections the write changed
+    and `mirrored` says it changed nothing else."""
+    scope = getattr(_WRITE_SCOPE, "scope", None)
+    if scope is not None:
+        # inside a writes_data call: the outermost writer bumps once for all of them
+        scope["touched"].update(touched)
+        scope["mirrored"] = scope["mirrored"] and mirrored
+    elif FIREBASE_ENABLED and not (mirrored and touched and _live_listening(touched)):
+        try:
+            DB.collection("config").document("version").set({"v": FS_MODULE.Increment(1)}, merge=True)
+        except Exception:
+            pass
+    if FIREBASE_ENABLED:
+        _live_mark_stale(*touched)
+    _invalidate_data_cache(repoll=True)
+
+def _freeze(v):
+    if isinstance(v, (list, tuple)):
+        return tuple(_freeze(x) for x in v)
+    if isinstance(v, dict):
+        return tuple(sorted((k, _freeze(x)) for k, x in v.items()))
+    if isinstance(v, (set, frozenset)):
+        return frozenset(v)
+    return v
+
+def cached_read(clone=copy.deepcopy, ttl: float = DATA_CACHE_TTL):
+    """Memoize a reader in the data cache; callers always get their own `clone` of the result."""
+    def decorate(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                key = (fn.__qualname__, _freeze(args), _freeze(kwargs))
+                hash(key)
+            except TypeError:
+                return fn(*args, **kwargs)
+            cache = _data_cache()
+            version = _data_version()
+            with cache["lock"]:
+                hit = cache["entries"].get(key)
+                if hit is not None and hit[0] == version and hit[1] > time.monotonic():
+                    cache["entries"].move_to_end(key)
+                    cache["hits"] += 1
+                    return clone(hit[2])
+                cache["misses"] += 1
+            value = fn(*args, **kwargs)
+            with cache["lock"]:
+                # stored under the version read before the call, so a concurrent write retires it
+                cache["entries"][key] = (version, time.monotonic() + ttl, value)
+                cache["entries"].move_to_end(key)
+                while len(cache["entries"]) > DATA_CACHE_MAX:
+                    cache["entries"].popitem(last=False)
+            return clone(value)
+        return wrapper
+    return decorate
+
+def writes_data(*touched: str, mirrored: bool = False):
+    """Bump the data version after a writer runs (also when it fails half-way).
+
+    Pass `mirrored=True` when the writer only changes the `touched` live-mirrored collections."""
+    def decorate(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            outer = getattr(_WRITE_SCOPE, "scope", None) is None
+            if outer:
+                _WRITE_SCOPE.scope = {"touched": set(), "mirrored": True}
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                if outer:
+                    scope, _WRITE_SCOPE.scope = _WRITE_SCOPE.scope, None
+                    _bump_data_version(*sorted(scope["touched"] | set(touched)), mirrored=scope["mirrored"] and mirrored)
+                else:
+                    _bump_data_version(*touched, mirrored=mirrored)
+        return wrapper
+    return decorate
+
+def _clone_records(data: dict) -> dict:
+    return {**data, "records": [dict(r) for r in data.get("records", [])]}
+
+# --- Shared JSON snapshots (local mode) ---
+# One parsed copy of each data file per server process, shared by all sessions.
+# An entry is reused while the file's (mtime, size) and the in-process write generation
+# are unchanged. Snapshots are read-only: load_* hand out fresh containers around the
+# shared rows, so callers may add/replace/remove entries but must not mutate rows in place.
+@st.cache_resource(show_spinner=False)
+def _json_snapshot_holder():
+    return {"entries": {}, "gen": {}, "lock": threading.Lock()}
+
+def _json_snapshot(path: Path):
+    key = os.path.abspath(path)
+    holder = _json_snapshot_holder()
+    info = os.stat(key)
+    stamp = (info.st_mtime_ns, info.st_size, holder["gen"].get(key, 0))
+    entry = holder["entries"].get(key)
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+    with holder["lock"]:
+        entry = holder["entries"].get(key)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        with open(key, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        holder["entries"][key] = (stamp, data)
+        return data
+
+def _mkstemp_beside(path: Path, prefix: str = ".tmp-"):
+    """Temp file next to `path` (same filesystem, for os.replace) keeping the file's mode."""
+    key = os.path.abspath(path)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(key), prefix=prefix, suffix=Path(key).suffix)
+    try:
+        os.chmod(tmp, os.stat(key).st_mode & 0o777)
+    except OSError:
+        os.chmod(tmp, 0o644)
+    return fd, tmp
+
+def _write_json(path: Path, data):
+    """Atomically replace a local data file and invalidate its shared snapshot."""
+    key = os.path.abspath(path)
+    fd, tmp = _mkstemp_beside(path)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, key)
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    holder = _json_snapshot_holder()
+    with holder["lock"]:
+        holder["gen"][key] = holder["gen"].get(key, 0) + 1
+        holder["entries"].pop(key, None)
+
+@cached_read()
+def load_users():
+    if FIREBASE_ENABLED:
+        return _fs_users_load()
+    if SQLITE_ENABLED:
+        return _sql_users_load()
+    ensure_files()
+    snap = _json_snapshot(USERS_PATH)
+    return {**snap, "users": {e: dict(u) for e, u in snap.get("users", {}).items()}}
+
+@writes_data("users", mirrored=True)
+def save_users(data):
+    if FIREBASE_ENABLED:
+        _fs_users_save(data)
+        return
+    if SQLITE_ENABLED:
+        _sql_users_save(data)
+        return
+    _write_json(USERS_PATH, data)
+
+# --- Local records store: compact snapshot + append-only JSONL log ---
+# records.json is a compacted snapshot and every user-day save appends a single
+# upsert/delete event keyed by (email, date) to records.log.jsonl. An in-memory
+# email -> date -> rows index is built from both on first use and kept current from
+# the log; once the log grows past RECORDS_LOG_COMPACT_EVENTS a background pass folds
+# it back into the snapshot. Local mode assumes one server process writes data/.
+@st.cache_resource(show_spinner=False)
+def _records_store():
+    return {"by_email": None, "flat": None, "stamp": None, "log_pos": 0, "log_events": 0,
+            "compacting": False, "lock": threading.RLock()}
+
+def _file_stamp(path: Path):
+    try:
+        info = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (info.st_mtime_ns, info.st_size)
+
+def _apply_record_event(store: dict, ev: dict):
+    # copy-on-write so readers iterating an older dict are never disturbed
+    email, date_s = ev.get("email"), ev.get("date")
+    if not email or not date_s:
+        return
+    rows = [{"email": email, "date": date_s, "product": code, "qty": int(qty), "ts": ev.get("ts", "")}
+            for code, qty in (ev.get("counts") or {}).items() if int(qty) > 0]
+    by_email = store["by_email"]
+    days = dict(by_email.get(email, {}))
+    if ev.get("op") == "upsert" and rows:
+        days[date_s] = rows
+    else:
+        days.pop(date_s, None)
+    if days:
+        if email in by_email:
+            by_email[email] = days
+        else:
+            store["by_email"] = {**by_email, email: days}
+    elif email in by_email:
+        store["by_email"] = {k: v for k, v in by_email.items() if k != email}
+    store["flat"] = None
+
+def _replay_records_log(store: dict):
+    try:
+        with open(RECORDS_LOG_PATH, "rb") as f:
+            f.seek(store["log_pos"])
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # partially written tail, picked up on the next call
+                store["log_pos"] += len(line)
+                try:
+                    ev = json.loads(line)
+                except ValueError:
+                    continue
+                _apply_record_event(store, ev)
+                store["log_events"] += 1
+    except FileNotFoundError:
+        pass
+
+def _load_records_store() -> dict:
+    store = _records_store()
+    with store["lock"]:
+        ensure_files()
+        stamp = _file_stamp(RECORDS_PATH)
+        log_size = (_file_stamp(RECORDS_LOG_PATH) or (0, 0))[1]
+        if store["by_email"] is None or stamp != store["stamp"] or log_size < store["log_pos"]:
+            with open(RECORDS_PATH, "r", encoding="utf-8") as f:
+                snap = json.load(f)
+            by_email = {}
+            for r in snap.get("records", []):
+                by_email.setdefault(r["email"], {}).setdefault(r["date"], []).append(r)
+            store.update(by_email=by_email, flat=None, stamp=stamp, log_pos=0, log_events=0)
+            _replay_records_log(store)
+            if not store["compacting"]:
+                # leftovers of a compaction pass interrupted by a restart
+                for stale in DATA_DIR.glob(".compact-*"):
+                    try:
+                        stale.unlink()
+                    except OSError:
+                        pass
+        elif log_size > store["log_pos"]:
+            _replay_records_log(store)
+        _maybe_compact_records(store)
+    return store
+
+def _local_user_days(email: str) -> dict:
+    """date -> rows for one user from the local records index (read-only)."""
+    return _load_records_store()["by_email"].get(email, {})
+
+def _append_record_events(events: list):
+    if not events:
+        return
+    store = _load_records_store()
+    payload = "".join(json.dumps(ev, ensure_ascii=False) + "\n" for ev in events).encode("utf-8")
+    with store["lock"]:
+        with open(RECORDS_LOG_PATH, "ab") as f:
+            f.write(payload)
+        _replay_records_log(store)
+        _maybe_compact_records(store)
+
+def _maybe_compact_records(store: dict):
+    if store["log_events"] >= RECORDS_LOG_COMPACT_EVENTS and not store["compacting"]:
+        store["compacting"] = True
+        threading.Thread(target=_compact_records_log, args=(store,), name="records-compaction", daemon=True).start()
+
+def _compact_records_log(store: dict):
+    """Write the current index as a compact records.json and drop the folded log prefix."""
+    tmp = None
+    try:
+        with store["lock"]:
+            rows = _flat_records(store)
+            pos = store["log_pos"]
+        fd, tmp = _mkstemp_beside(RECORDS_PATH, prefix=".compact-")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"records": rows}, f, ensure_ascii=False, separators=(",", ":"))
+        with store["lock"]:
+            # events appended while the snapshot was written are kept in the new log
+            with open(RECORDS_LOG_PATH, "rb") as f:
+                f.seek(pos)
+                tail = f.read()
+            os.replace(tmp, RECORDS_PATH)
+            tmp = None
+            _write_log_atomic(tail)
+            store["stamp"] = _file_stamp(RECORDS_PATH)
+            store["log_pos"] = len(tail)
+            store["log_events"] = tail.count(b"\n")
+    except Exception:
+        # a failed pass leaves snapshot + log consistent; the next save retries
+        store["by_email"] = None
+    finally:
+        if tmp:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+        store["compacting"] = False
+
+def _write_log_atomic(content: bytes):
+    fd, tmp = _mkstemp_beside(RECORDS_LOG_PATH)
+    with os.fdopen(fd, "wb") as f:
+        f.write(content)
+    os.replace(tmp, RECORDS_LOG_PATH)
+
+def _flat_records(store: dict) -> list:
+    if store["flat"] is None:
+        store["flat"] = [r for days in store["by_email"].values() for rows in days.values() for r in rows]
+    return store["flat"]
+
+@cached_read(clone=_clone_records)
+def load_records():
+    if FIREBASE_ENABLED:
+        return _fs_records_load()
+    if SQLITE_ENABLED:
+        return _sql_records_load()
+    store = _load_records_store()
+    with store["lock"]:
+        return {"records": list(_flat_records(store))}
+
+@writes_data()
+def save_records(data):
+    if FIREBASE_ENABLED:
+        _fs_records_replace_all(data)
+        return
+    if SQLITE_ENABLED:
+        _sql_records_replace_all(data)
+        return
+    store = _records_store()
+    with store["lock"]:
+        _write_json(RECORDS_PATH, data)
+        _write_log_atomic(b"")
+        store["by_email"] = None
+
+@cached_read()
+def load_bonus_schedules():
+    if FIREBASE_ENABLED or SQLITE_ENABLED:
+        data = _fs_bonus_load() if FIREBASE_ENABLED else _sql_bonus_load()
+        data["schedules"].sort(key=lambda s: s["effective_date"])
+        return data
+    ensure_files()
+    data = copy.deepcopy(_json_snapshot(BONUSES_PATH))
+    data["schedules"].sort(key=lambda s: s["effective_date"])
+    return data
+
+@writes_data("bonuses", mirrored=True)
+def save_bonus_schedules(data):
+    data["schedules"].sort(key=lambda s: s["effective_date"])
+    data["version"] = _save_bonus_versioned({"schedules": list(data.get("schedules", []))})
+    _publish_bonus_index(data["schedules"], data["version"])
+# --- Extended bonus config helpers (products + schedules) ---
+@cached_read()
+def load_bonus_config():
+    if FIREBASE_ENABLED or SQLITE_ENABLED:
+        if FIREBASE_ENABLED:
+            data = _live_get("bonuses")
+            if data is not None:
+                data = copy.deepcopy(data)
+            else:
+                doc = DB.collection("config").document("bonuses").get()
+                data = (doc.to_dict() or {}) if doc.exists else {}
+        else:
+            data = _sql_config_load("bonuses") or {}
+        if "schedules" not in data:
+            base_prices = {p["code"]: int(p["bonus"]) for p in PRODUCTS}
+            data["schedules"] = [{"effective_date": "1970-01-01", "prices": base_prices}]
+        if "products" not in data or not data["products"]:
+            data["products"] = list(PRODUCTS)
+        try:
+            data["schedules"].sort(key=lambda s: s["effective_date"])
+        except Exception:
+            pass
+        return data
+    ensure_files()
+    try:
+        data = copy.deepcopy(_json_snapshot(BONUSES_PATH))
+    except Exception:
+        data = {}
+    if "schedules" not in data:
+        base_prices = {p["code"]: int(p["bonus"]) for p in PRODUCTS}
+        data["schedules"] = [{"effective_date": "1970-01-01", "prices": base_prices}]
+    if "products" not in data or not data["products"]:
+        data["products"] = list(PRODUCTS)
+    try:
+        data["schedules"].sort(key=lambda s: s["effective_date"])
+    except Exception:
+        pass
+    return data
+
+@writes_data("bonuses", mirrored=True)
+def save_bonus_config(data: dict):
+    data = dict(data)
+    schedules = list(data.get("schedules", []))
+    try:
+        schedules.sort(key=lambda s: s["effective_date"])
+    except Exception:
+        pass
+    products = list(data.get("products", []))
+    version = _save_bonus_versioned({"schedules": schedules, "products": products})
+    _publish_bonus_index(schedules, version)
+
+@cached_read()
+def load_products():
+    cfg = load_bonus_config()
+    return list(cfg.get("products", [])) or list(PRODUCTS)
+
+@writes_data("bonuses", mirrored=True)
+def save_products(products: list):
+    cfg = load_bonus_config()
+    cfg["products"] = list(products)
+    save_bonus_config(cfg)
+
+_PRODUCTS_VERSION = None
+
+def refresh_products(force: bool = False):
+    """Reload PRODUCTS/PRODUCT_INDEX when the data version moved since the last load."""
+    global PRODUCTS, PRODUCT_INDEX, _PRODUCTS_VERSION
+    version = _data_version()
+    if version == _PRODUCTS_VERSION and not force:
+        return
+    try:
+        prods = load_products()
+        if prods:
+            PRODUCTS = list(prods)
+            PRODUCT_INDEX = {p["code"]: p for p in PRODUCTS}
+        _PRODUCTS_VERSION = version
+    except Exception:
+        PRODUCT_INDEX = {p["code"]: p for p in PRODUCTS}
+
+@cached_read()
+def load_messages():
+    if FIREBASE_ENABLED:
+        return _fs_messages_load()
+    if SQLITE_ENABLED:
+        return _sql_messages_load()
+    ensure_files()
+    snap = _json_snapshot(MSGS_PATH)
+    return {**snap, "messages": [dict(m) for m in snap.get("messages", [])]}
+
+@writes_data("messages", mirrored=True)
+def save_messages(data):
+    if FIREBASE_ENABLED:
+        _fs_messages_save(data)
+        return
+    if SQLITE_ENABLED:
+        _sql_messages_save(data)
+        return
+    _write_json(MSGS_PATH, data)
+
+@writes_data("messages", mirrored=True)
+def create_message(text: str, target_all: bool, target_emails: list, target_teams: list, sticky: bool=True, meta: dict|None=None, title: str|None=None, sender: str|None=None):
+    msg = {
+        "id": str(uuid.uuid4()),
+        "title": title or "הודעה",
+        "text": text,
+        "target_all": bool(target_all),
+        "target_emails": sorted({e.lower().strip() for e in (target_emails or [])}),
+        "target_teams": list(sorted(set(target_teams or []))),
+        "created_at": datetime.now(APP_TZ).isoformat(),
+        "active": True,
+        "sticky": bool(sticky),
+        "meta": meta or {},
+        "sender": (sender or "system"),
+    }
+    if FIREBASE_ENABLED:
+        DB.collection("messages").document(msg["id"]).set(msg, merge=True)
+        return msg["id"]
+    if SQLITE_ENABLED:
+        _sql_message_put(msg)
+        return msg["id"]
+    data = load_messages()
+    data["messages"].append(msg)
+    save_messages(data)
+    return msg["id"]
+
+def _message_update_fields(fields: dict) -> dict:
+    allowed = {k:v for k,v in fields.items() if k in {"text","target_all","target_emails","target_teams","active","sticky","meta"}}
+    # stored the way create_message stores them, so targeting lookups match exactly
+    if "target_emails" in allowed:
+        allowed["target_emails"] = sorted({e.lower().strip() for e in (allowed["target_emails"] or [])})
+    if "target_teams" in allowed:
+        allowed["target_teams"] = sorted(set(allowed["target_teams"] or []))
+    return allowed
+
+@writes_data("messages", mirrored=True)
+def update_message(msg_id: str, **fields):
+    allowed = _message_update_fields(fields)
+    if FIREBASE_ENABLED:
+        DB.collection("messages").document(msg_id).set(allowed, merge=True)
+        return True
+    if SQLITE_ENABLED:
+        return _sql_message_merge(msg_id, lambda m: m.update(allowed))
+    data = load_messages()
+    for m in data["messages"]:
+        if m["id"] == msg_id:
+            m.update(allowed)
+            save_messages(data)
+            return True
+    return False
+
+@writes_data("messages", mirrored=True)
+def delete_message(msg_id: str):
+    if FIREBASE_ENABLED:
+        DB.collection("messages").document(msg_id).delete()
+        return
+    if SQLITE_ENABLED:
+        with _SqlSession() as conn:
+            conn.execute("DELETE FROM messages WHERE id = ?", (msg_id,))
+            conn.execute("DELETE FROM message_targets WHERE message_id = ?", (msg_id,))
+            conn.execute("DELETE FROM message_receipts WHERE message_id = ?", (msg_id,))
+        return
+    data = load_messages()
+    data["messages"] = [m for m in data["messages"] if m["id"] != msg_id]
+    save_messages(data)
+
+# --- Message targeting index ---
+# Pop-up lookups only touch messages addressed to the user: an inverted index
+# (everyone / team / email -> active message ids) kept in memory for local JSON and the
+# Firestore live mirror, rebuilt only when the message set itself changes; the
+# message_targets table in SQLite; array_contains queries in Firestore otherwise.
+def _message_targets(m: dict) -> list:
+    """(kind, target) pairs a message is addressed to; inactive messages have none."""
+    if not m.get("active", True):
+        return []
+    pairs = [("all", "")] if m.get("target_all") else []
+    pairs += [("team", t) for t in set(m.get("target_teams") or []) if t]
+    pairs += [("email", e.lower().strip()) for e in set(m.get("target_emails") or []) if e]
+    return pairs
+
+@st.cache_resource(show_spinner=False)
+def _message_index_holder():
+    return {"source": None, "index": None, "lock": threading.Lock()}
+
+def _message_index(source, messages) -> dict:
+    """Index over `messages()`, reused while they come from the very same `source` object.
+
+    `messages` is called only on a miss, so a reused index costs no pass over the set.
+    """
+    holder = _message_index_holder()
+    with holder["lock"]:
+        if holder["source"] is source and holder["index"] is not None:
+            return holder["index"]
+        index = {"by_id": {}, "dismissed": {}, "all": [], "team": {}, "email": {}}
+        for m in messages():
+            pairs = _message_targets(m)
+            if not pairs:
+                continue
+            index["by_id"][m["id"]] = m
+            index["dismissed"][m["id"]] = frozenset(m.get("dismissed_for") or ())
+            for kind, target in pairs:
+                if kind == "all":
+                    index["all"].append(m["id"])
+                else:
+                    index[kind].setdefault(target, []).append(m["id"])
+        holder["source"], holder["index"] = source, index
+        return index
+
+def _targeted_messages(email: str, team: str) -> list:
+    """[(message, legacy dismissed_for)] for active messages addressed to everyone, `team` or `email`."""
+    if FIREBASE_ENABLED:
+        mirror = _live_get("messages", shared=True)
+        if mirror is not None:
+            index = _message_index(mirror, lambda: [{**m, "id": m.get("id", mid)} for mid, m in mirror.items()])
+        else:
+            col = DB.collection("messages")
+            try:
+                docs = list(col.where("active", "==", True).where("target_all", "==", True).stream())
+                if team:
+                    docs += list(col.where("target_teams", "array_contains", team).stream())
+                docs += list(col.where("target_emails", "array_contains", email).stream())
+                found = {}
+                for d in docs:
+                    m = d.to_dict() or {}
+                    m.setdefault("id", d.id)
+                    if m.get("active", True):
+                        found[m["id"]] = m
+                msgs = list(found.values())
+            except Exception:
+                msgs = [m for m in load_messages().get("messages", []) if _message_targets(m)]
+            return [(m, frozenset(m.get("dismissed_for") or ())) for m in msgs
+                    if ("all", "") in _message_targets(m) or ("team", team) in _message_targets(m) or ("email", email) in _message_targets(m)]
+    elif SQLITE_ENABLED:
+        return [(m, frozenset(m.get("dismissed_for") or ())) for m in _sql_messages_for(email, team)]
+    else:
+        ensure_files()
+        snap = _json_snapshot(MSGS_PATH)
+        index = _message_index(snap, lambda: snap.get("messages", []))
+    ids = dict.fromkeys(index["all"] + index["team"].get(team, []) + index["email"].get(email, []))
+    return [(index["by_id"][i], index["dismissed"][i]) for i in ids]
+
+@cached_read()
+def eligible_messages_for_user(user: dict):
+    email = user["email"].lower().strip()
+    team = user.get("team","")
+    seen = dismissed_message_ids(email)
+    msgs = [m for m, legacy in _targeted_messages(email, team) if m["id"] not in seen and email not in legacy]
+    msgs.sort(key=lambda x: x.get("created_at",""))
+    return msgs
+
+@cached_read()
+def read_messages_for_user(user: dict):
+    """Active messages addressed to `user` that they already dismissed, newest first."""
+    email = user["email"].lower().strip()
+    seen = dismissed_message_ids(email)
+    msgs = [m for m, legacy in _targeted_messages(email, user.get("team","")) if m["id"] in seen or email in legacy]
+    msgs.sort(key=lambda x: x.get("created_at",""), reverse=True)
+    return msgs
+
+# --- Message receipts ---
+# Dismissals live in the reader's own inbox (Firestore `inbox/{email}`, SQLite
+# message_receipts, data/inbox.json locally) rather than on the message, so a broadcast
+# does not grow with headcount and readers never contend for one document. Messages
+# sent before this may still carry a `dismissed_for` list; it is read but never written.
+def _json_inbox() -> dict:
+    ensure_files()
+    return _json_snapshot(INBOX_PATH).get("inbox", {})
+
+@cached_read(clone=set)
+def dismissed_message_ids(email: str) -> set:
+    """Ids of the messages `email` has dismissed."""
+    email = email.lower().strip()
+    if FIREBASE_ENABLED:
+        snap = DB.collection("inbox").document(email).get()
+        return set((snap.to_dict() or {}).get("dismissed") or {}) if snap.exists else set()
+    if SQLITE_ENABLED:
+        with _SqlSession() as conn:
+            return {r[0] for r in conn.execute("SELECT message_id FROM message_receipts WHERE email = ?", (email,))}
+    return set(_json_inbox().get(email, {}))
+
+def message_dismissed(m: dict, email: str, seen: set) -> bool:
+    """Whether `email` dismissed `m`, given their `dismissed_message_ids`."""
+    return m["id"] in seen or email in (m.get("dismissed_for") or ())
+
+@writes_data()
+def mark_dismissed_for_user(msg_ids, user_email: str):
+    """Record that `user_email` dismissed a message id (or a list of them)."""
+    ids = [msg_ids] if isinstance(msg_ids, str) else list(msg_ids)
+    user_email = user_email.lower().strip()
+    if not ids:
+        return
+    ts = now_ij().isoformat()
+    if FIREBASE_ENABLED:
+        # merged into a map field: no read first, and parallel dismissals keep each other's entries
+        DB.collection("inbox").document(user_email).set({"dismissed": {mid: ts for mid in ids}}, merge=True)
+        return
+    if SQLITE_ENABLED:
+        with _SqlSession() as conn:
+            conn.executemany("INSERT OR IGNORE INTO message_receipts(email, message_id, dismissed_at) VALUES (?, ?, ?)",
+                             [(user_email, mid, ts) for mid in ids])
+        return
+    inbox = dict(_json_inbox())
+    inbox[user_email] = {**inbox.get(user_email, {}), **{mid: ts for mid in ids}}
+    _write_json(INBOX_PATH, {"inbox": inbox})
+
+# --- Compiled bonus-schedule index ---
+# Schedules are compiled once per process into sorted effective-date ordinals and a
+# product x schedule price matrix. When the data version moves (any write, here or in
+# another process) the stored config version is compared with the compiled one and the
+# index is recompiled only if they differ, so lookups stay free of I/O in between.
+@st.cache_resource(show_spinner=False)
+def _bonus_index_holder():
+    return {"index": None, "checked": None, "lock": threading.Lock()}
+
+@lru_cache(maxsize=8192)
+def _iso_ordinal(date_s: str) -> int:
+    return date.fromisoformat(date_s).toordinal()
+
+def _compile_bonus_index(schedules: list, version: int = 0) -> dict:
+    scheds = sorted(schedules or [], key=lambda s: s["effective_date"])
+    ordinals = [_iso_ordinal(s["effective_date"]) for s in scheds]
+    rows = {code: i for i, code in enumerate(sorted({c for s in scheds for c in (s.get("prices") or {})}))}
+    matrix = [[None] * len(scheds) for _ in rows]
+    for col, sch in enumerate(scheds):
+        for code, price in (sch.get("prices") or {}).items():
+            matrix[rows[code]][col] = int(price)
+    return {"version": int(version or 0), "ordinals": ordinals, "rows": rows, "matrix": matrix}
+
+def _bonus_index() -> dict:
+    holder = _bonus_index_holder()
+    idx, seen = holder["index"], _data_version()
+    if idx is None or holder["checked"] != seen:
+        # loaded outside the lock: the first load may start the live listeners, whose
+        # bonuses handler publishes into this holder
+        data = load_bonus_schedules()
+        with holder["lock"]:
+            idx = holder["index"]
+            if idx is None or int(data.get("version", 0) or 0) != idx["version"]:
+                idx = _compile_bonus_index(data["schedules"], data.get("version", 0))
+                holder["index"] = idx
+            holder["checked"] = seen
+    return idx
+
+def _publish_bonus_index(schedules: list, version: int):
+    idx = _compile_bonus_index(schedules, version)
+    holder = _bonus_index_holder()
+    with holder["lock"]:
+        holder["index"] = idx
+
+def _save_bonus_versioned(fields: dict) -> int:
+    """Merge `fields` into the stored bonus config under the next version; returns that version.
+
+    The version is read from the stored document in the same transaction as the write, so
+    two processes saving at once never stamp the same number."""
+    if FIREBASE_ENABLED:
+        ref = DB.collection("config").document("bonuses")
+
+        @FS_MODULE.transactional
+        def bump(transaction):
+            snap = ref.get(transaction=transaction)
+            version = int(((snap.to_dict() or {}) if snap.exists else {}).get("version", 0) or 0) + 1
+            transaction.set(ref, {**fields, "version": version}, merge=True)
+            return version
+
+        return bump(DB.transaction())
+    if SQLITE_ENABLED:
+        with _SqlSession() as conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")  # hold the write lock across the read
+            row = conn.execute("SELECT data FROM config WHERE key = 'bonuses'").fetchone()
+            current = json.loads(row[0]) if row else {}
+            version = int(current.get("version", 0) or 0) + 1
+            conn.execute(
+                "INSERT INTO config(key, data) VALUES ('bonuses', ?) ON CONFLICT(key) DO UPDATE SET data = excluded.data",
+                (json.dumps({**current, **fields, "version": version}, ensure_ascii=False),),
+            )
+        return version
+    ensure_files()
+    current = _json_snapshot(BONUSES_PATH)
+    version = int(current.get("version", 0) or 0) + 1
+    _write_json(BONUSES_PATH, {**current, **fields, "version": version})
+    return version
+
+def get_bonus_for(product_code: str, on_date: str | date) -> int:
+    if isinstance(on_date, date):
+        d_ord = on_date.toordinal()
+    else:
+        d_ord = _iso_ordinal(on_date)
+    idx = _bonus_index()
+    price = None
+    row = idx["rows"].get(product_code)
+    if row is not None:
+        # before the first effective date we fall back to the earliest schedule
+        col = max(0, bisect.bisect_right(idx["ordinals"], d_ord) - 1)
+        price = idx["matrix"][row][col]
+    if price is None:
+        price = PRODUCT_INDEX.get(product_code, {}).get("bonus", 0)
+    return int(price)
+
+def hash_password(password: str) -> str:
+    if not bcrypt:
+        import hashlib, secrets
+        salt = secrets.token_hex(16)
+        digest = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt.encode("utf-8"), 200_000).hex()
+        return f"pbkdf2${salt}${digest}"
+    salt = bcrypt.gensalt()
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+def check_password(password: str, hashed: str) -> bool:
+    if hashed.startswith("pbkdf2$"):
+        import hashlib
+        _, salt, digest = hashed.split("$", 2)
+        check = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt.encode("utf-8"), 200_000).hex()
+        return check == digest
+    if not bcrypt:
+        return False
+    try:
+        return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+    except Exception:
+        return False
+@writes_data("users", mirrored=True)
+def set_last_login(email: str):
+    """Stamp last login for user (Firebase, SQLite and local JSON modes)."""
+    ts = now_ij().isoformat()
+    email_l = email.lower().strip()
+    if FIREBASE_ENABLED:
+        try:
+            DB.collection("users").document(email_l).set({"last_login_at": ts}, merge=True)
+        except Exception:
+            pass
+    elif SQLITE_ENABLED:
+        _sql_user_update(email_l, {"last_login_at": ts})
+    else:
+        db = load_users()
+        u = db.get("users", {}).get(email_l)
+        if u is not None:
+            u["last_login_at"] = ts
+            db["users"][email_l] = u
+            save_users(db)
+
+# --- Sessions ---
+# One entry per login keyed by sid (Firestore `sessions/{sid}`, SQLite `sessions` table,
+# data/sessions.json locally), so a user may stay signed in on several devices and
+# auto-login is a point lookup. Expiry is enforced on read. Validated sids are kept
+# in-process for SESSION_CACHE_TTL seconds so page loads usually skip storage entirely.
+@st.cache_resource(show_spinner=False)
+def _session_cache():
+    return {"entries": {}, "lock": threading.Lock(), "write_lock": threading.Lock()}
+
+def _session_cache_drop(email: str | None = None, sid: str | None = None):
+    cache = _session_cache()
+    with cache["lock"]:
+        if sid is not None:
+            cache["entries"].pop(sid, None)
+        if email is not None:
+            for k in [k for k, v in cache["entries"].items() if v["user"].get("email") == email]:
+                cache["entries"].pop(k, None)
+
+def _session_expired(expires_at: str) -> bool:
+    try:
+        return datetime.fromisoformat(expires_at) <= now_ij()
+    except Exception:
+        return True
+
+def _json_sessions() -> dict:
+    ensure_files()
+    return _json_snapshot(SESSIONS_PATH).get("sessions", {})
+
+def _json_sessions_save(sessions: dict):
+    # expired entries are dropped on every write, which keeps the file bounded
+    _write_json(SESSIONS_PATH, {"sessions": {k: v for k, v in sessions.items() if not _session_expired(v.get("expires_at", ""))}})
+
+def _session_payload(email: str, hours: int = 8):
+    ts_start = now_ij()
+    expires = ts_start + timedelta(hours=hours)
+    sid = str(uuid.uuid4())
+    return sid, {"email": email, "created_at": ts_start.isoformat(), "expires_at": expires.isoformat()}, expires
+
+def _fs_session_doc(sess: dict, expires: datetime) -> dict:
+    # `expire_at` is a timestamp so a Firestore TTL policy can purge old sessions
+    return {**sess, "expire_at": expires}
+
+def _sql_session_insert(conn, sid: str, sess: dict, expires: datetime):
+    conn.execute("DELETE FROM sessions WHERE expires_epoch <= ?", (time.time(),))
+    conn.execute("INSERT INTO sessions(sid, email, created_at, expires_at, expires_epoch) VALUES (?, ?, ?, ?, ?)",
+                 (sid, sess["email"], sess["created_at"], sess["expires_at"], expires.timestamp()))
+
+def start_user_session(email: str, hours: int = 8) -> tuple[str, str]:
+    """Open a new session for this user (other devices stay signed in) and return (sid, expires_at_iso)."""
+    email_l = email.lower().strip()
+    sid, sess, expires = _session_payload(email_l, hours)
+    if FIREBASE_ENABLED:
+        try:
+            DB.collection("sessions").document(sid).set(_fs_session_doc(sess, expires))
+        except Exception:
+            # If session write fails, we still allow login – the user just won't get auto-login from the URL.
+            pass
+    elif SQLITE_ENABLED:
+        with _SqlSession() as conn:
+            _sql_session_insert(conn, sid, sess, expires)
+    else:
+        with _session_cache()["write_lock"]:
+            _json_sessions_save({**_json_sessions(), sid: sess})
+    return sid, sess["expires_at"]
+
+
+def clear_user_session(email: str, sid: str | None = None):
+    """End one session (logout) or, without `sid`, every session of the user."""
+    email_l = email.lower().strip()
+    _session_cache_drop(email=email_l)
+    if FIREBASE_ENABLED:
+        try:
+            if sid:
+                DB.collection("sessions").document(sid).delete()
+            else:
+                refs = [d.reference for d in DB.collection("sessions").where("email", "==", email_l).stream()]
+                _fs_bulk_write([("delete", ref, None) for ref in refs])
+        except Exception:
+            # Logout should not crash the app if Firestore write fails
+            pass
+    elif SQLITE_ENABLED:
+        with _SqlSession() as conn:
+            if sid:
+                conn.execute("DELETE FROM sessions WHERE sid = ? AND email = ?", (sid, email_l))
+            else:
+                conn.execute("DELETE FROM sessions WHERE email = ?", (email_l,))
+    else:
+        with _session_cache()["write_lock"]:
+            sessions = _json_sessions()
+            kept = {k: v for k, v in sessions.items() if not (v.get("email") == email_l and (sid is None or k == sid))}
+            if len(kept) != len(sessions):
+                _json_sessions_save(kept)
+
+
+def _session_lookup(sid: str):
+    """The stored session dict for `sid`, or None."""
+    if FIREBASE_ENABLED:
+        snap = DB.collection("sessions").document(sid).get()
+        return snap.to_dict() if snap.exists else None
+    if SQLITE_ENABLED:
+        with _SqlSession() as conn:
+            row = conn.execute("SELECT email, created_at, expires_at FROM sessions WHERE sid = ?", (sid,)).fetchone()
+        return {"email": row[0], "created_at": row[1], "expires_at": row[2]} if row else None
+    sess = _json_sessions().get(sid)
+    return dict(sess) if sess else None
+
+def _user_get(email: str):
+    """One user record by email (point read where the backend allows it)."""
+    if FIREBASE_ENABLED:
+        live = _live_get("users")
+        if live is not None:
+            u = live.get(email)
+            return {**u, "email": u.get("email", email)} if u is not None else None
+        snap = DB.collection("users").document(email).get()
+        if not snap.exists:
+            return None
+        u = snap.to_dict() or {}
+        u.setdefault("email", email)
+        return u
+    if SQLITE_ENABLED:
+        return _sql_user_get(email)
+    ensure_files()
+    u = _json_snapshot(USERS_PATH).get("users", {}).get(email)
+    if u is None:
+        return None
+    return {**u, "email": u.get("email", email)}
+
+def get_user_by_session(sid: str):
+    """Lookup the user behind a live session id (for auto-login from URL)."""
+    sid = (sid or "").strip()
+    if not sid:
+        return None
+    cache = _session_cache()
+    hit = cache["entries"].get(sid)
+    if hit is not None and time.monotonic() - hit["checked"] < SESSION_CACHE_TTL and not _session_expired(hit["expires_at"]):
+        return dict(hit["user"])
+    try:
+        sess = _session_lookup(sid)
+        if not sess:
+            _session_cache_drop(sid=sid)
+            return None
+        if _session_expired(sess.get("expires_at", "")):
+            clear_user_session(sess.get("email", ""), sid)
+            return None
+        u = _user_get(sess["email"])
+    except Exception:
+        return None
+    if not u:
+        return None
+    u["session_sid"] = sid
+    u["session_expires_at"] = sess["expires_at"]
+    with cache["lock"]:
+        cache["entries"][sid] = {"user": dict(u), "expires_at": sess["expires_at"], "checked": time.monotonic()}
+    return u
+
+
+
+
+def now_ij():
+    return datetime.now(APP_TZ)
+
+def week_bounds(d: date):
+    weekday = (d.weekday() + 1) % 7
+    start = d - timedelta(days=weekday)
+    end = start + timedelta(days=6)
+    return start, end
+
+def month_bounds(d: date):
+    start = d.replace(day=1)
+    if start.month == 12:
+        nxt = start.replace(year=start.year+1, month=1, day=1)
+    else:
+        nxt = start.replace(month=start.month+1, day=1)
+    end = nxt - timedelta(days=1)
+    return start, end
+
+def fmt_ts(ts: str) -> str:
+    if not ts:
+        return ""
+    try:
+        dt = datetime.fromisoformat(ts)
+        try:
+            dt = dt.astimezone(APP_TZ)
+        except Exception:
+            pass
+        return dt.strftime("%d.%m.%Y %H:%M")
+    except Exception:
+        return ts
+
+def _random_hex_color(existing: set[str]):
+    while True:
+        h = random.randint(0, 359)
+        s = random.randint(60, 90)
+        l = random.randint(45, 60)
+        import colorsys
+        r,g,b = colorsys.hls_to_rgb(h/360.0, l/100.0, s/100.0)
+        hexc = f"#{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}"
+        if hexc not in existing:
+            return hexc
+
+def new_user_payload(name, email, password, team, invisible=False):
+    udb = load_users()
+    existing_colors = {u.get("color","") for u in udb.get("users",{}).values()}
+    color = _random_hex_color(existing_colors)
+    return {
+        "name": name,
+        "email": email.lower().strip(),
+        "team": team.strip(),
+        "invisible": bool(invisible),
+        "password": hash_password(password),
+        "created_at": now_ij().isoformat(),
+        "goals": {"daily": 0, "weekly": 0, "monthly": 0},
+        "color": color,
+        "is_admin": False
+    }
+
+@writes_data("users", mirrored=True)
+def register_user(name, email, password, team, invisible):
+    dbu = load_users()
+    email_l = email.lower().strip()
+    if email_l in dbu["users"]:
+        return False, "האימייל כבר רשום במערכת."
+    payload = new_user_payload(name, email_l, password, team, invisible)
+    if FIREBASE_ENABLED:
+        DB.collection("users").document(email_l).set(payload, merge=True)
+        return True, "נרשמת בהצלחה! אפשר להתחבר."
+    if SQLITE_ENABLED:
+        _sql_user_update(email_l, payload, create=True)
+        return True, "נרשמת בהצלחה! אפשר להתחבר."
+    dbu["users"][email_l] = payload
+    save_users(dbu)
+    return True, "נרשמת בהצלחה! אפשר להתחבר."
+
+def authenticate(email, password):
+    email_l = email.lower().strip()
+    try:
+        user = _user_get(email_l)
+    except Exception:
+        user = None
+    if not user:
+        return False, "משתמש לא נמצא."
+    if not check_password(password, user["password"]):
+        return False, "סיסמה שגויה."
+    # On successful authentication, stamp last login and open a new server-side session in one write
+    ts = now_ij().isoformat()
+    sid, sess, expires = _session_payload(email_l)
+    if FIREBASE_ENABLED:
+        try:
+            batch = DB.batch()
+            batch.set(DB.collection("users").document(email_l), {"last_login_at": ts}, merge=True)
+            batch.set(DB.collection("sessions").document(sid), _fs_session_doc(sess, expires))
+            batch.commit()
+        except Exception:
+            # Same as before: a failed stamp/session write does not block the login itself
+            pass
+    elif SQLITE_ENABLED:
+        with _SqlSession() as conn:
+            conn.execute("UPDATE users SET data = json_set(data, '$.last_login_at', ?) WHERE email = ?", (ts, email_l))
+            _sql_session_insert(conn, sid, sess, expires)
+    else:
+        db = load_users()
+        db["users"][email_l] = {**db["users"].get(email_l, user), "last_login_at": ts}
+        save_users(db)
+        with _session_cache()["write_lock"]:
+            _json_sessions_save({**_json_sessions(), sid: sess})
+    _bump_data_version("users", mirrored=True)  # sessions are not read through the data cache
+    # The returned user is built in memory rather than re-read
+    user.update(last_login_at=ts, session_sid=sid, session_expires_at=sess["expires_at"])
+    return True, user
+
+@writes_data("users", mirrored=True)
+def update_user(email, **fields):
+    if "is_admin" in fields:
+        fields.pop("is_admin")
+    _session_cache_drop(email=email.lower().strip())
+    if FIREBASE_ENABLED:
+        email_l = email.lower().strip()
+        DB.collection("users").document(email_l).set(fields, merge=True)
+        return True, "עודכן בהצלחה."
+    if SQLITE_ENABLED:
+        if not _sql_user_update(email.lower().strip(), fields):
+            return False, "משתמש לא נמצא."
+        return True, "עודכן בהצלחה."
+    db = load_users()
+    user = db["users"].get(email.lower().strip())
+    if not user:
+        return False, "משתמש לא נמצא."
+    user.update(fields)
+    db["users"][email.lower().strip()] = user
+    save_users(db)
+    return True, "עודכן בהצלחה."
+
+@writes_data("users")
+def delete_user(email):
+    _session_cache_drop(email=email.lower().strip())
+    if FIREBASE_ENABLED:
+        email_l = email.lower().strip()
+        DB.collection("users").document(email_l).delete()
+        DB.collection("inbox").document(email_l).delete()
+        refs = [d.reference for d in DB.collection("records").where("email", "==", email_l).stream()]
+        refs += [d.reference for d in DB.collection("daily_rollups").where("email", "==", email_l).stream()]
+        refs += [d.reference for d in DB.collection("sessions").where("email", "==", email_l).stream()]
+        _fs_bulk_write([("delete", ref, None) for ref in refs])
+        return True
+    if SQLITE_ENABLED:
+        with _SqlSession() as conn:
+            conn.execute("DELETE FROM users WHERE email = ?", (email,))
+            conn.execute("DELETE FROM records WHERE email = ?", (email,))
+            conn.execute("DELETE FROM sessions WHERE email = ?", (email,))
+            conn.execute("DELETE FROM message_receipts WHERE email = ?", (email,))
+        return True
+    dbu = load_users()
+    if email in dbu["users"]:
+        dbu["users"].pop(email, None)
+        save_users(dbu)
+    inbox = _json_inbox()
+    if email in inbox:
+        _write_json(INBOX_PATH, {"inbox": {k: v for k, v in inbox.items() if k != email}})
+    with _session_cache()["write_lock"]:
+        sessions = _json_sessions()
+        kept = {k: v for k, v in sessions.items() if v.get("email") != email}
+        if len(kept) != len(sessions):
+            _json_sessions_save(kept)
+    _append_record_events([{"op": "delete", "email": email, "date": date_s} for date_s in _local_user_days(email)])
+    return True
+
+@writes_data()
+def add_or_set_counts(email: str, d: date, counts: dict):
+    date_s = d.isoformat()
+    ts = now_ij().isoformat()
+    if FIREBASE_ENABLED:
+        kept = {code: int(qty) for code, qty in counts.items() if int(qty) > 0}
+        col = DB.collection("records")
+        rollup_ref = DB.collection("daily_rollups").document(_rollup_id(email, date_s))
+
+        @FS_MODULE.transactional
+        def save_day(transaction):
+            # records, rollup and leaderboard deltas commit together; re-saving the same counts is a no-op
+            old, legacy = _fs_day_previous(transaction, email, date_s, rollup_ref)
+            for ref in legacy:
+                transaction.delete(ref)
+            for code in old:
+                if code not in kept:
+                    transaction.delete(col.document(_record_id(email, date_s, code)))
+            for code, qty in kept.items():
+                transaction.set(col.document(_record_id(email, date_s, code)),
+                                {"email": email, "date": date_s, "product": code, "qty": qty, "ts": ts})
+            if kept:
+                transaction.set(rollup_ref, {**_day_rollup(email, date_s, kept, ts), "keyed": True})
+            else:
+                transaction.delete(rollup_ref)
+            for key, delta in _leaderboard_deltas(date_s, old, kept).items():
+                transaction.set(_fs_leaderboard_ref(key, _leaderboard_shard(email)),
+                                {"period": key, "scores": {email: FS_MODULE.Increment(delta)}, "seq": FS_MODULE.Increment(1)}, merge=True)
+
+        save_day(DB.transaction())
+        return
+    if SQLITE_ENABLED:
+        _sql_records_set_day(email, date_s, counts, ts)
+        return
+    old = {r["product"]: int(r["qty"]) for r in _local_user_days(email).get(date_s, [])}
+    kept = {code: int(qty) for code, qty in counts.items() if int(qty) > 0}
+    _append_record_events([{"op": "upsert" if kept else "delete", "email": email, "date": date_s, "ts": ts, "counts": kept}])
+    _local_leaderboards_bump(email, _leaderboard_deltas(date_s, old, counts))
+
+# --- Bulk import ---
+# Months of history arrive as one CSV (email, date, product, qty). The file is read row by
+# row, rows are validated and folded into {(email, date): {product: qty}}, and every
+# user-day found replaces that day's counts, as the per-day form would, but in a few large
+# writes: chunked parallel batches in Firestore, one transaction per chunk of days in
+# SQLite, a single log append locally. Affected leaderboards are rebuilt on their next read.
+IMPORT_COLUMNS = ("email", "date", "product", "qty")
+IMPORT_SQL_CHUNK = 5000
+IMPORT_MAX_ERRORS = 50
+
+def _import_date(value: str) -> date:
+    value = value.strip()
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return datetime.strptime(value, "%d/%m/%Y").date()
+
+def _import_read(text, progress, size_of) -> tuple:
+    """(days, errors, rows, skipped) from a CSV text stream."""
+    reader = csv.DictReader(text)
+    header = {(h or "").strip().lower(): h for h in (reader.fieldnames or [])}
+    missing = [c for c in IMPORT_COLUMNS if c not in header]
+    if missing:
+        raise ValueError("חסרות עמודות: " + ", ".join(missing))
+    known = set(load_users().get("users", {}))
+    today = now_ij().date()
+    days, errors, rows, skipped = {}, [], 0, 0
+    for line, row in enumerate(reader, 2):
+        rows += 1
+        email = (row.get(header["email"]) or "").strip().lower()
+        product = (row.get(header["product"]) or "").strip()
+        reason = None
+        try:
+            d = _import_date(row.get(header["date"]) or "")
+        except ValueError:
+            reason = "תאריך לא תקין"
+        try:
+            qty = int(float((row.get(header["qty"]) or "").strip()))
+        except (ValueError, OverflowError):
+            qty, reason = 0, reason or "כמות לא תקינה"
+        if email not in known:
+            reason = "משתמש לא קיים"
+        elif product not in PRODUCT_INDEX:
+            reason = "מוצר לא מוכר"
+        elif reason is None and (qty < 0 or d > today):
+            reason = "כמות שלילית" if qty < 0 else "תאריך עתידי"
+        if reason:
+            skipped += 1
+            if len(errors) < IMPORT_MAX_ERRORS:
+                errors.append((line, reason))
+            continue
+        day = days.setdefault((email, d.isoformat()), {})
+        day[product] = day.get(product, 0) + qty
+        if rows % 5000 == 0:
+            progress("read", *size_of())
+    return days, errors, rows, skipped
+
+@writes_data()
+def import_records_csv(f, progress=None) -> dict:
+    """Set daily counts from a CSV file object (bytes or text); see IMPORT_COLUMNS.
+
+    Repeated (email, date, product) rows add up. Invalid rows are skipped and listed in the
+    summary as (line, reason). `progress(stage, done, total)` is called while reading
+    ("read", in bytes) and writing ("write"). Raises ValueError if a column is missing."""
+    t0 = time.perf_counter()
+    progress = progress or (lambda stage, done, total: None)
+    raw = getattr(f, "buffer", f)
+    try:
+        start = raw.tell(); raw.seek(0, 2); size = raw.tell() - start; raw.seek(start)
+    except Exception:
+        start, size = None, 0
+
+    def size_of():
+        try:
+            return raw.tell() - start, size
+        except Exception:
+            return 0, size
+
+    text = f if isinstance(f, io.TextIOBase) else io.TextIOWrapper(f, encoding="utf-8-sig", newline="")
+    try:
+        days, errors, rows, skipped = _import_read(text, progress, size_of)
+    finally:
+        if text is not f:
+            text.detach()  # leave the caller's file open
+    progress("read", size, size)
+
+    ts = now_ij().isoformat()
+    days = {key: {code: qty for code, qty in counts.items() if qty > 0} for key, counts in days.items()}
+    if FIREBASE_ENABLED:
+        _fs_import_days(days, ts, progress)
+    elif SQLITE_ENABLED:
+        items = list(days.items())
+        for i in range(0, len(items), IMPORT_SQL_CHUNK):
+            with _SqlSession() as conn:
+                for (email, date_s), counts in items[i:i+IMPORT_SQL_CHUNK]:
+                    conn.execute("DELETE FROM records WHERE email = ? AND date = ?", (email, date_s))
+                    conn.executemany("INSERT INTO records(email, date, product, qty, ts) VALUES (?, ?, ?, ?, ?)",
+                                     [(email, date_s, code, qty, ts) for code, qty in counts.items()])
+            progress("write", min(i + IMPORT_SQL_CHUNK, len(items)), len(items))
+    else:
+        _append_record_events([{"op": "upsert" if counts else "delete", "email": email, "date": date_s, "ts": ts, "counts": counts}
+                               for (email, date_s), counts in days.items()])
+        progress("write", len(days), len(days))
+    _leaderboards_drop({key for _, date_s in days for key in leaderboard_periods(date.fromisoformat(date_s)).values()})
+    return {
+        "rows": rows,
+        "imported_rows": rows - skipped,
+        "skipped": skipped,
+        "errors": errors,
+        "days": len(days),
+        "users": len({email for email, _ in days}),
+        "seconds": round(time.perf_counter() - t0, 2),
+    }
+
+def _fs_import_days(days: dict, ts: str, progress):
+    """Write imported user-days as keyed records plus rollups, replacing what those days held."""
+    col = DB.collection("records")
+    rollups = DB.collection("daily_rollups")
+    by_user = {}
+    for email, date_s in days:
+        by_user.setdefault(email, []).append(date_s)
+    ops = []
+    for i, (email, dates) in enumerate(by_user.items(), 1):
+        # one range query per user finds every document the imported days replace
+        wanted, existing = set(dates), {}
+        for d in col.where("email", "==", email).where("date", ">=", min(dates)).where("date", "<=", max(dates)).stream():
+            r = d.to_dict() or {}
+            if r.get("date") in wanted:
+                existing.setdefault(r["date"], []).append(d.reference)
+        for date_s in dates:
+            counts = days[(email, date_s)]
+            keep = {_record_id(email, date_s, code) for code in counts}
+            group = [("delete", ref, None) for ref in existing.get(date_s, []) if ref.id not in keep]
+            group += [("set", col.document(_record_id(email, date_s, code)),
+                       {"email": email, "date": date_s, "product": code, "qty": qty, "ts": ts}) for code, qty in counts.items()]
+            rollup_ref = rollups.document(_rollup_id(email, date_s))
+            group.append(("set", rollup_ref, {**_day_rollup(email, date_s, counts, ts), "keyed": True}) if counts else ("delete", rollup_ref, None))
+            ops.append(group)
+        progress("read", i, len(by_user))
+    _fs_bulk_write(ops, on_batch=lambda done, total: progress("write", done, total))
+
+@cached_read()
+def get_counts_for_user_date(email: str, d: date):
+    date_s = d.isoformat()
+    if FIREBASE_ENABLED and _rollups_ready():
+        out = {p["code"]: 0 for p in PRODUCTS}
+        snap = DB.collection("daily_rollups").document(_rollup_id(email, date_s)).get()
+        if snap.exists:
+            for code, qty in ((snap.to_dict() or {}).get("products") or {}).items():
+                out[code] = out.get(code, 0) + int(qty)
+        return out
+    if FIREBASE_ENABLED:
+        q = DB.collection("records").where("email","==",email).where("date","==",date_s).stream()
+        out = {p["code"]: 0 for p in PRODUCTS}
+        for doc in q:
+            r = doc.to_dict() or {}
+            out[r.get("product","")] = out.get(r.get("product",""),0) + int(r.get("qty",0))
+        return out
+    if SQLITE_ENABLED:
+        out = {p["code"]: 0 for p in PRODUCTS}
+        out.update(_sql_product_totals(email, date_s, date_s))
+        return out
+    out = {p["code"]: 0 for p in PRODUCTS}
+    for r in _local_user_days(email).get(date_s, []):
+        out[r["product"]] = out.get(r["product"], 0) + int(r["qty"])
+    return out
+
+@cached_read()
+def aggregate_user_counts(email: str, start_d: date, end_d: date):
+    s = start_d.isoformat(); e = end_d.isoformat()
+    if FIREBASE_ENABLED and _rollups_ready():
+        out = {p["code"]: 0 for p in PRODUCTS}
+        for r in _fs_rollups_range([email], s, e):
+            for code, qty in (r.get("products") or {}).items():
+                out[code] = out.get(code, 0) + int(qty)
+        return out
+    if FIREBASE_ENABLED:
+        q = DB.collection("records").where("email","==",email).where("date",">=",s).where("date","<=",e).stream()
+        out = {p["code"]: 0 for p in PRODUCTS}
+        for doc in q:
+            r = doc.to_dict() or {}
+            out[r.get("product","")] = out.get(r.get("product",""),0) + int(r.get("qty",0))
+        return out
+    if SQLITE_ENABLED:
+        out = {p["code"]: 0 for p in PRODUCTS}
+        out.update(_sql_product_totals(email, s, e))
+        return out
+    out = {p["code"]: 0 for p in PRODUCTS}
+    for date_s, rows in _local_user_days(email).items():
+        if s <= date_s <= e:
+            for r in rows:
+                out[r["product"]] = out.get(r["product"], 0) + int(r["qty"])
+    return out
+
+@cached_read()
+def sum_bonus_for_email_range(email: str, start_d: date, end_d: date) -> int:
+    s = start_d.isoformat(); e = end_d.isoformat()
+    total = 0
+    if FIREBASE_ENABLED and _rollups_ready():
+        return int(sum(_rollup_bonus(r) for r in _fs_rollups_range([email], s, e)))
+    if FIREBASE_ENABLED:
+        q = DB.collection("records").where("email","==",email).where("date",">=",s).where("date","<=",e).stream()
+        for doc in q:
+            r = doc.to_dict() or {}
+            total += int(r.get("qty",0)) * get_bonus_for(r.get("product",""), r.get("date", s))
+        return int(total)
+    if SQLITE_ENABLED:
+        for date_s, code, qty in _sql_day_product_totals(email, s, e):
+            total += int(qty) * get_bonus_for(code, date_s)
+        return int(total)
+    for date_s, rows in _local_user_days(email).items():
+        if s <= date_s <= e:
+            for r in rows:
+                total += int(r["qty"]) * get_bonus_for(r["product"], date_s)
+    return int(total)
+
+@cached_read()
+def aggregate_members_range(emails: list, start_d: date, end_d: date):
+    """Per-product counts and bonus totals for many users from one pass over the date range.
+
+    Returns (counts, bonuses) keyed by email, same shapes as aggregate_user_counts /
+    sum_bonus_for_email_range.
+    """
+    s = start_d.isoformat(); e = end_d.isoformat()
+    wanted = set(emails)
+    counts = {em: {p["code"]: 0 for p in PRODUCTS} for em in wanted}
+    bonuses = {em: 0 for em in wanted}
+    if not wanted:
+        return counts, bonuses
+
+    def add(email, date_s, code, qty):
+        c = counts[email]
+        c[code] = c.get(code, 0) + qty
+        bonuses[email] += qty * get_bonus_for(code, date_s)
+
+    if FIREBASE_ENABLED and _rollups_ready():
+        for r in _fs_rollups_range(sorted(wanted), s, e):
+            c = counts[r["email"]]
+            for code, qty in (r.get("products") or {}).items():
+                c[code] = c.get(code, 0) + int(qty)
+            bonuses[r["email"]] += _rollup_bonus(r)
+    elif FIREBASE_ENABLED:
+        col = DB.collection("records")
+        if len(wanted) <= 30:
+            # Firestore 'in' filters take at most 30 values; bigger groups scan the range once
+            q = col.where("email", "in", sorted(wanted)).where("date", ">=", s).where("date", "<=", e)
+        else:
+            q = col.where("date", ">=", s).where("date", "<=", e)
+        for doc in q.stream():
+            r = doc.to_dict() or {}
+            if r.get("email") in wanted:
+                add(r["email"], r.get("date", s), r.get("product", ""), int(r.get("qty", 0)))
+    elif SQLITE_ENABLED:
+        with _SqlSession() as conn:
+            rows = conn.execute(
+                "SELECT email, date, product, SUM(qty) FROM records WHERE date BETWEEN ? AND ? GROUP BY email, date, product",
+                (s, e),
+            ).fetchall()
+        for email, date_s, code, qty in rows:
+            if email in wanted:
+                add(email, date_s, code, int(qty))
+    else:
+        for email in wanted:
+            for date_s, rows in _local_user_days(email).items():
+                if s <= date_s <= e:
+                    for r in rows:
+                        add(email, date_s, r["product"], int(r["qty"]))
+    return counts, {em: int(b) for em, b in bonuses.items()}
+
+@cached_read()
+def all_users_list(include_invisible=True):
+    db = load_users()
+    users = list(db.get("users", {}).values())
+    return users if include_invisible else [u for u in users if not u.get("invisible")]
+
+@cached_read()
+def team_members(team: str, include_invisible=False):
+    users = all_users_list(include_invisible=include_invisible)
+    return [u for u in users if u.get("team","").strip() == team.strip()]
+
+def team_aggregate(team: str, start_d: date, end_d: date, include_invisible=False):
+    members = team_members(team, include_invisible=include_invisible)
+    counts, bonuses = aggregate_members_range([m["email"] for m in members], start_d, end_d)
+    return members, counts, bonuses
+
+@cached_read()
+def group_members_by_filter(team_filter: str, include_invisible: bool):
+    if team_filter == "ALL":
+        return all_users_list(include_invisible=include_invisible)
+    return team_members(team_filter, include_invisible=include_invisible)
+
+# --- Materialized leaderboards ---
+# One board per calendar week and month holding every user's bonus total for the period.
+# Each save adds only the saving user's delta; in Firestore a board is split over
+# LEADERBOARD_SHARDS documents by a hash of the email, so concurrent saves rarely touch
+# the same document. Every change bumps the board's `seq`. Reads check the board against
+# the current bonus-config version; a missing or stale board is rebuilt from a single
+# range aggregation outside the read cache and only stored if its `seq` did not move
+# meanwhile, so a rebuild never overwrites a delta saved while it ran. Team boards are
+# the global board filtered by current membership, so moving a user between teams never
+# leaves stale entries behind.
+LEADERBOARD_SHARDS = 8
+
+def leaderboard_periods(d: date) -> dict:
+    ws, _ = week_bounds(d)
+    return {"week": f"week:{ws.isoformat()}", "month": f"month:{d.strftime('%Y-%m')}"}
+
+def _leaderboard_range(period_key: str):
+    kind, start_s = period_key.split(":", 1)
+    if kind == "week":
+        return week_bounds(date.fromisoformat(start_s))
+    return month_bounds(date.fromisoformat(start_s + "-01"))
+
+def _leaderboard_deltas(date_s: str, old_counts: dict, new_counts: dict) -> dict:
+    def day_bonus(counts):
+        return sum(int(qty) * get_bonus_for(code, date_s) for code, qty in counts.items() if int(qty) > 0)
+    delta = day_bonus(new_counts) - day_bonus(old_counts)
+    if not delta:
+        return {}
+    return {key: delta for key in leaderboard_periods(date.fromisoformat(date_s)).values()}
+
+def _leaderboard_shard(email: str) -> int:
+    return zlib.crc32(email.encode("utf-8")) % LEADERBOARD_SHARDS
+
+def _fs_leaderboard_ref(period_key: str, shard: int):
+    return DB.collection("leaderboards").document(f"{period_key}#{shard}")
+
+def _fs_leaderboard_shards(period_key: str, transaction=None) -> dict:
+    q = DB.collection("leaderboards").where("period", "==", period_key)
+    return {d.id: d.to_dict() or {} for d in q.stream(transaction=transaction)}
+
+def _fs_leaderboard_stamp(shards: dict):
+    return tuple(sorted((i, d.get("seq"), d.get("version")) for i, d in shards.items()))
+
+def _sql_leaderboards_touch(conn, period_keys, drop: bool = False):
+    # bump each board's seq (and forget its version when dropping) inside the caller's transaction
+    bumped = "COALESCE(json_extract(data, '$.seq'), 0) + 1"
+    conn.executemany(
+        "INSERT INTO config(key, data) VALUES (?, '{\"seq\": 1}') ON CONFLICT(key) DO UPDATE SET data = "
+        + (f"json_object('seq', {bumped})" if drop else f"json_set(data, '$.seq', {bumped})"),
+        [(f"leaderboard:{key}",) for key in period_keys],
+    )
+
+@st.cache_resource(show_spinner=False)
+def _local_leaderboards():
+    return {"boards": {}, "lock": threading.Lock()}
+
+def _local_leaderboard(holder: dict, period_key: str) -> dict:
+    return holder["boards"].setdefault(period_key, {"scores": {}, "version": None, "seq": 0})
+
+def _local_leaderboards_bump(email: str, deltas: dict):
+    holder = _local_leaderboards()
+    with holder["lock"]:
+        for key, delta in deltas.items():
+            board = _local_leaderboard(holder, key)
+            board["scores"][email] = board["scores"].get(email, 0) + delta
+            board["seq"] += 1
+
+def _leaderboard_load(period_key: str):
+    """(scores, version, stamp) as stored; version is None for a board that was never built
+    and stamp changes with every save, drop or rebuild that touches the board."""
+    if FIREBASE_ENABLED:
+        shards = _fs_leaderboard_shards(period_key)
+        scores = {e: int(b) for d in shards.values() for e, b in (d.get("scores") or {}).items()}
+        versions = {d.get("version") for d in shards.values()}
+        version = versions.pop() if len(shards) == LEADERBOARD_SHARDS and len(versions) == 1 else None
+        return scores, version, _fs_leaderboard_stamp(shards)
+    if SQLITE_ENABLED:
+        with _SqlSession() as conn:
+            rows = conn.execute("SELECT email, bonus FROM leaderboards WHERE period = ?", (period_key,)).fetchall()
+            meta = _sql_config_load(f"leaderboard:{period_key}") or {}
+        return {e: int(b) for e, b in rows}, meta.get("version"), meta.get("seq")
+    holder = _local_leaderboards()
+    with holder["lock"]:
+        board = holder["boards"].get(period_key)
+        return (dict(board["scores"]), board["version"], board["seq"]) if board else ({}, None, None)
+
+def _leaderboard_store(period_key: str, scores: dict, version: int, stamp) -> bool:
+    """Replace a board unless its stamp moved since `stamp` was loaded; False when skipped."""
+    if FIREBASE_ENABLED:
+        built_at = now_ij().isoformat()
+
+        @FS_MODULE.transactional
+        def store(transaction):
+            shards = _fs_leaderboard_shards(period_key, transaction)
+            if _fs_leaderboard_stamp(shards) != stamp:
+                return False
+            for n in range(LEADERBOARD_SHARDS):
+                ref = _fs_leaderboard_ref(period_key, n)
+                transaction.set(ref, {"period": period_key, "version": version, "built_at": built_at,
+                                      "scores": {e: b for e, b in scores.items() if _leaderboard_shard(e) == n},
+                                      "seq": int(shards.get(ref.id, {}).get("seq") or 0) + 1})
+            return True
+
+        return store(DB.transaction())
+    if SQLITE_ENABLED:
+        with _SqlSession() as conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")  # hold the write lock across the stamp check
+            row = conn.execute("SELECT data FROM config WHERE key = ?", (f"leaderboard:{period_key}",)).fetchone()
+            if (json.loads(row[0]) if row else {}).get("seq") != stamp:
+                return False
+            conn.execute("DELETE FROM leaderboards WHERE period = ?", (period_key,))
+            conn.executemany("INSERT INTO leaderboards(period, email, bonus) VALUES (?, ?, ?)",
+                             [(period_key, e, int(b)) for e, b in scores.items()])
+            conn.execute("INSERT INTO config(key, data) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET data = excluded.data",
+                         (f"leaderboard:{period_key}", json.dumps({"version": version, "seq": int(stamp or 0) + 1})))
+        return True
+    holder = _local_leaderboards()
+    with holder["lock"]:
+        board = holder["boards"].get(period_key)
+        if (board["seq"] if board else None) != stamp:
+            return False
+        holder["boards"][period_key] = {"scores": dict(scores), "version": version, "seq": int(stamp or 0) + 1}
+    return True
+
+def _leaderboards_drop(period_keys):
+    """Mark stored boards stale so their next read rebuilds them (after bulk changes)."""
+    period_keys = sorted(period_keys)
+    if FIREBASE_ENABLED:
+        _fs_bulk_write([("merge", _fs_leaderboard_ref(key, n), {"period": key, "version": None, "seq": FS_MODULE.Increment(1)})
+                        for key in period_keys for n in range(LEADERBOARD_SHARDS)])
+    elif SQLITE_ENABLED:
+        with _SqlSession() as conn:
+            _sql_leaderboards_touch(conn, period_keys, drop=True)
+    else:
+        holder = _local_leaderboards()
+        with holder["lock"]:
+            for key in period_keys:
+                board = _local_leaderboard(holder, key)
+                board["version"] = None
+                board["seq"] += 1
+
+@cached_read()
+def _leaderboard_stored(period_key: str):
+    return _leaderboard_load(period_key)
+
+def _leaderboard_rebuild(period_key: str, version: int) -> dict:
+    """Recompute a board from the records and store it unless it changed meanwhile."""
+    # uncached reads: the stamp must be taken before the aggregation it guards
+    scores, stored, stamp = _leaderboard_load(period_key)
+    if stored != version:
+        start_d, end_d = _leaderboard_range(period_key)
+        emails = [u["email"] for u in all_users_list() if u.get("email")]
+        _, bonuses = aggregate_members_range.__wrapped__(emails, start_d, end_d)
+        scores = {e: b for e, b in bonuses.items() if b}
+        if not _leaderboard_store(period_key, scores, version, stamp):
+            return scores  # a save landed meanwhile; the next read rebuilds again
+    # the board is current now (here or in another process): drop the stale cached load
+    _invalidate_data_cache()
+    return scores
+
+def _leaderboard_scores(period_key: str) -> dict:
+    scores, version, _ = _leaderboard_stored(period_key)
+    current = _bonus_index()["version"]
+    if version != current:
+        scores = _leaderboard_rebuild(period_key, current)
+    return scores
+
+def _leaderboard_rows(period_key: str, team: str | None = None, include_invisible: bool = False) -> list:
+    members = group_members_by_filter(team or "ALL", include_invisible=include_invisible)
+    scores = _leaderboard_scores(period_key)
+    rows = [(m["email"], int(scores.get(m["email"], 0))) for m in members if m.get("email")]
+    rows.sort(key=lambda r: (-r[1], r[0]))
+    return rows
+
+def leaderboard_top(period_key: str, k: int = 10, team: str | None = None, include_invisible: bool = False) -> list:
+    """[(email, bonus)] of the k best users for a period, optionally within one team."""
+    return _leaderboard_rows(period_key, team, include_invisible)[:k]
+
+def leaderboard_rank(email: str, period_key: str, team: str | None = None, include_invisible: bool = False):
+    """(rank, out_of, bonus) for one user; rank is None when the user is not on the board."""
+    rows = _leaderboard_rows(period_key, team, include_invisible)
+    mine = next((b for e, b in rows if e == email), None)
+    if mine is None:
+        return None, len(rows), 0
+    return 1 + sum(1 for _, b in rows if b > mine), len(rows), mine
+
+def _display_label(member: dict) -> str:
+    name = member.get("name","")
+    team = member.get("team","")
+    return f"{name} · {team}" if team else name
+
+def _bonus_price_table() -> pd.DataFrame:
+    """(effective, product, price) rows of the compiled schedule index, cached per version."""
+    idx = _bonus_index()
+    table = idx.get("table")
+    if table is None:
+        ordinals = list(idx["ordinals"])
+        if ordinals:
+            ordinals[0] = 1  # dates before the first schedule use the earliest one
+        rows = [(o, code, prices[col])
+                for code, prices in ((c, idx["matrix"][r]) for c, r in idx["rows"].items())
+                for col, o in enumerate(ordinals)]
+        table = pd.DataFrame(rows, columns=["effective", "product", "price"])
+        table["effective"] = table["effective"].astype("int64")
+        table["price"] = table["price"].astype("float64")
+        table = table.sort_values("effective", kind="stable").reset_index(drop=True)
+        idx["table"] = table
+    return table
+
+def _date_ordinals(dates: pd.Series):
+    # ISO date strings -> proleptic Gregorian ordinals (date.toordinal), vectorized
+    days = pd.to_datetime(dates, format="%Y-%m-%d").to_numpy().astype("datetime64[D]").astype("int64")
+    return days + date(1970, 1, 1).toordinal()
+
+def _price_records(df: pd.DataFrame) -> pd.Series:
+    """Unit bonus per row of a records frame (columns date/product), via one merge_asof."""
+    left = pd.DataFrame({"day": _date_ordinals(df["date"]), "product": df["product"].astype(str), "row": range(len(df))})
+    left = left.sort_values("day", kind="stable")
+    table = _bonus_price_table()
+    if table.empty:
+        merged = left.assign(price=float("nan"))
+    else:
+        merged = pd.merge_asof(left, table, left_on="day", right_on="effective", by="product", direction="backward")
+    price = merged.set_index("row")["price"].sort_index()
+    # products missing from the applicable schedule fall back to the catalog default
+    defaults = df["product"].map({c: p.get("bonus", 0) for c, p in PRODUCT_INDEX.items()}).fillna(0).to_numpy()
+    return price.fillna(pd.Series(defaults, index=price.index)).astype("int64")
+
+@cached_read(clone=lambda df: df.copy())
+def build_group_timeseries(members: list, period: str, start_d: date | None = None, end_d: date | None = None) -> pd.DataFrame:
+    if not members:
+        return pd.DataFrame()
+    email_to_label = {m["email"]: _display_label(m) for m in members}
+    today = now_ij().date()
+    # Support custom explicit start/end if provided
+    custom = (period == "CUSTOM") or (start_d is not None and end_d is not None)
+    hourly = False
+    if custom:
+        if start_d is None or end_d is None:
+            start_d = end_d = today
+    elif period == "היום":
+        start_d = end_d = today
+        hourly = True
+    elif period == "שבוע נוכחי":
+        start_d, end_d = week_bounds(today)
+    else:
+        start_d, end_d = month_bounds(today)
+    s = start_d.isoformat(); e = end_d.isoformat()
+    if hourly:
+        idx = pd.Index(range(24), name="שעה")
+    else:
+        idx = pd.Index([start_d + timedelta(n) for n in range((end_d-start_d).days+1)], name="תאריך")
+
+    if FIREBASE_ENABLED and not hourly and _rollups_ready():
+        # daily buckets only need one priced rollup per user-day
+        recs = [{"email": r["email"], "date": r["date"], "product": "", "qty": 1, "ts": "", "bonus": _rollup_bonus(r)}
+                for r in _fs_rollups_range(list(email_to_label), s, e)]
+    elif FIREBASE_ENABLED:
+        docs = DB.collection("records").where("date", ">=", s).where("date","<=", e).stream()
+        recs = [r for r in (d.to_dict() or {} for d in docs) if r.get("email") in email_to_label]
+    elif SQLITE_ENABLED:
+        recs = [r for r in _sql_records_between(s, e) if r["email"] in email_to_label]
+    else:
+        by_email = _load_records_store()["by_email"]
+        recs = [r for email in email_to_label for date_s, rows in by_email.get(email, {}).items() if s <= date_s <= e for r in rows]
+    if not recs:
+        return pd.DataFrame(index=idx)
+
+    df = pd.DataFrame.from_records(recs, columns=["email", "date", "product", "qty", "ts", "bonus"])
+    df = df[df["email"].isin(list(email_to_label)) & df["date"].between(s, e)]
+    if df.empty:
+        return pd.DataFrame(index=idx)
+    df = df.reset_index(drop=True)
+    if df["bonus"].isna().any():
+        df["bonus"] = pd.to_numeric(df["qty"], errors="coerce").fillna(0).astype("int64") * _price_records(df)
+    if hourly:
+        ts = pd.to_datetime(df["ts"], errors="coerce", utc=True, format="ISO8601")
+        df["bucket"] = ts.dt.tz_convert(APP_TZ).dt.hour.fillna(0).astype(int)
+    else:
+        df["bucket"] = _date_ordinals(df["date"])
+    df_p = df.groupby(["bucket", "email"])["bonus"].sum().unstack("email", fill_value=0)
+    if not hourly:
+        df_p.index = [date.fromordinal(int(o)) for o in df_p.index]
+    df_p = df_p.rename(columns=email_to_label)
+    # Ensure full bucket coverage (e.g., 24 hours for "היום" or full date range) so single events still render as a line
+    return df_p.reindex(idx, fill_value=0)
+
+# --- Report pages ---
+# The personal reports table is read one page at a time with keyset cursors instead of
+# loading the whole range: Firestore orders by (date, document id) and resumes with
+# start_after, SQLite seeks on the (email, date, product) primary key. A cursor is a
+# plain (date, key) tuple, so pages can be cached and kept in session state.
+REPORT_PAGE_SIZE = 100
+
+@cached_read()
+def records_page(email: str, start_d: date, end_d: date, page_size: int = REPORT_PAGE_SIZE, cursor=None):
+    """One page of a user's records in [start_d, end_d] -> (rows, cursor of the next page or None)."""
+    s, e = start_d.isoformat(), end_d.isoformat()
+    if FIREBASE_ENABLED:
+        q = (DB.collection("records").where("email", "==", email).where("date", ">=", s).where("date", "<=", e)
+             .order_by("date").order_by("__name__"))
+        if cursor is not None:
+            q = q.start_after({"date": cursor[0], "__name__": cursor[1]})
+        # one extra document tells whether another page follows
+        docs = list(q.limit(page_size + 1).stream())
+        more = len(docs) > page_size
+        docs = docs[:page_size]
+        rows = [r for r in (d.to_dict() or {} for d in docs) if {"date", "product", "qty"} <= set(r)]
+        return rows, ((docs[-1].get("date"), docs[-1].id) if more else None)
+    if SQLITE_ENABLED:
+        after = cursor or ("", "")
+        with _SqlSession() as conn:
+            found = conn.execute(
+                "SELECT email, date, product, qty, ts FROM records WHERE email = ? AND date BETWEEN ? AND ? "
+                "AND (date, product) > (?, ?) ORDER BY date, product LIMIT ?",
+                (email, s, e, *after, page_size + 1),
+            ).fetchall()
+        rows = [{"email": em, "date": d, "product": p, "qty": q, "ts": t} for em, d, p, q, t in found]
+    else:
+        days = _local_user_days(email)
+        after = cursor or ("", "")
+        rows = []
+        for date_s in sorted(d for d in days if s <= d <= e and d >= after[0]):
+            for r in sorted(days[date_s], key=lambda r: r["product"]):
+                if (date_s, r["product"]) > after:
+                    rows.append(r)
+            if len(rows) > page_size:
+                break
+    more = len(rows) > page_size
+    rows = rows[:page_size]
+    return rows, ((rows[-1]["date"], rows[-1]["product"]) if more else None)
+
+# --- Exports ---
+# Report files are generated only when a download is clicked. Rows are streamed from
+# storage a chunk at a time (the Firestore query stream, keyset pages in SQLite, the
+# local index) and written straight into the file instead of through a DataFrame. CSV is
+# always available; Parquet needs pyarrow and XLSX needs openpyxl (write-only mode).
+EXPORT_CHUNK = 5000
+EXPORT_COLUMNS = [
+    ("date", "תאריך"), ("name", "שם"), ("team", "צוות"), ("email", "אימייל"), ("product", "מוצר"),
+    ("qty", "כמות"), ("unit_bonus", "בונוס ליחידה (לפי תאריך)"), ("bonus", "סה\"כ בונוס"), ("ts", "עדכון"),
+]
+EXPORT_MIME = {
+    "csv": "text/csv",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+def export_formats() -> list:
+    """Export formats whose writer library is installed, CSV first."""
+    from importlib.util import find_spec
+    return ["csv"] + [fmt for fmt, module in (("xlsx", "openpyxl"), ("parquet", "pyarrow")) if find_spec(module)]
+
+def _iter_records(s: str, e: str, emails=None):
+    """Raw records between s and e (inclusive ISO dates), optionally for some users only."""
+    wanted = set(emails) if emails is not None else None
+    if wanted is not None and not wanted:
+        return  # an empty selection, not "everyone"
+    if FIREBASE_ENABLED:
+        col = DB.collection("records")
+        if wanted is not None and len(wanted) == 1:
+            q = col.where("email", "==", next(iter(wanted)))
+        elif wanted is not None and len(wanted) <= 30:
+            q = col.where("email", "in", sorted(wanted))
+        else:
+            q = col
+        # the SDK fetches further result pages as the stream is consumed
+        for d in q.where("date", ">=", s).where("date", "<=", e).stream():
+            r = d.to_dict() or {}
+            if {"email", "date", "product", "qty"} <= set(r) and (wanted is None or r["email"] in wanted):
+                yield r
+    elif SQLITE_ENABLED:
+        # keyset pages: the connection lock is only held while a page is fetched
+        after = ("", "", "")
+        while True:
+            with _SqlSession() as conn:
+                rows = conn.execute(
+                    "SELECT email, date, product, qty, ts FROM records WHERE date BETWEEN ? AND ? "
+                    "AND (date, email, product) > (?, ?, ?) ORDER BY date, email, product LIMIT ?",
+                    (s, e, *after, EXPORT_CHUNK),
+                ).fetchall()
+            for em, d, p, q, t in rows:
+                if wanted is None or em in wanted:
+                    yield {"email": em, "date": d, "product": p, "qty": q, "ts": t}
+            if len(rows) < EXPORT_CHUNK:
+                return
+            after = (rows[-1][1], rows[-1][0], rows[-1][2])
+    else:
+        by_email = _load_records_store()["by_email"]
+        for email in sorted(wanted if wanted is not None else by_email):
+            for date_s in sorted(by_email.get(email, {})):
+                if s <= date_s <= e:
+                    yield from by_email[email][date_s]
+
+def _export_rows(s: str, e: str, emails=None):
+    users = load_users().get("users", {})
+    for r in _iter_records(s, e, emails):
+        u = users.get(r["email"], {})
+        unit = get_bonus_for(r["product"], r["date"])
+        yield {
+            "date": r["date"], "name": u.get("name", ""), "team": u.get("team", ""), "email": r["email"],
+            "product": PRODUCT_INDEX.get(r["product"], {}).get("name", r["product"]),
+            "qty": int(r["qty"]), "unit_bonus": int(unit), "bonus": int(r["qty"]) * int(unit), "ts": r.get("ts", "") or "",
+        }
+
+def _export_csv(rows) -> bytes:
+    buf = io.BytesIO()
+    text = io.TextIOWrapper(buf, encoding="utf-8-sig", newline="")
+    writer = csv.writer(text, quoting=csv.QUOTE_NONNUMERIC)
+    writer.writerow([label for _, label in EXPORT_COLUMNS])
+    for r in rows:
+        writer.writerow([r[key] for key, _ in EXPORT_COLUMNS])
+    text.flush()
+    text.detach()
+    return buf.getvalue()
+
+def _export_parquet(rows) -> bytes:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    types = {"qty": pa.int64(), "unit_bonus": pa.int64(), "bonus": pa.int64()}
+    schema = pa.schema([(key, types.get(key, pa.string())) for key, _ in EXPORT_COLUMNS])
+    sink = pa.BufferOutputStream()
+    with pq.ParquetWriter(sink, schema) as writer:
+        chunk = []
+        for r in rows:
+            chunk.append(r)
+            if len(chunk) == EXPORT_CHUNK:
+                writer.write_table(pa.Table.from_pylist(chunk, schema=schema))
+                chunk = []
+        if chunk:
+            writer.write_table(pa.Table.from_pylist(chunk, schema=schema))
+    return sink.getvalue().to_pybytes()
+
+def _export_xlsx(rows) -> bytes:
+    """One sheet per team plus a per-user x product pivot; rows are never held in memory."""
+    from openpyxl import Workbook
+    wb = Workbook(write_only=True)
+    pivot_ws = wb.create_sheet("לפי מוצר")
+    header = [label for _, label in EXPORT_COLUMNS]
+    sheets, pivot, products = {}, {}, [p["name"] for p in PRODUCTS]
+    for r in rows:
+        ws = sheets.get(r["team"])
+        if ws is None:
+            title = f"צוות {r['team']}" if r["team"] else "ללא צוות"
+            ws = sheets[r["team"]] = wb.create_sheet("".join(c for c in title if c not in "[]:*?/\\")[:31])
+            ws.append(header)
+        ws.append([r[key] for key, _ in EXPORT_COLUMNS])
+        counts = pivot.setdefault((r["team"], r["name"], r["email"]), {})
+        counts[r["product"]] = counts.get(r["product"], 0) + r["qty"]
+        if r["product"] not in products:
+            products.append(r["product"])
+    pivot_ws.append(["צוות", "שם", "אימייל"] + products + ["סה\"כ פריטים"])
+    for (team, name, email), counts in sorted(pivot.items()):
+        pivot_ws.append([team, name, email] + [counts.get(p, 0) for p in products] + [sum(counts.values())])
+    buf = io.BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+def export_records(fmt: str, start_d: date, end_d: date, emails=None) -> bytes:
+    """A `fmt` file ("csv" | "xlsx" | "parquet") of the records between two dates."""
+    writer = {"csv": _export_csv, "xlsx": _export_xlsx, "parquet": _export_parquet}[fmt]
+    return writer(_export_rows(start_d.isoformat(), end_d.isoformat(), emails))
+
+# --- Parquet archive ---
+# A snapshot of the records as a month-partitioned Parquet dataset
+# (data/archive/month=YYYY-MM/records.parquet) with dictionary-encoded email and product
+# columns and the bonus resolved at the day's prices. archive_records() (run periodically,
+# see tools/archive_records.py) rebuilds missing months plus the most recent ones;
+# archive_scan() reads only the partitions a date range touches. Needs pyarrow.
+ARCHIVE_DIR = Path(os.environ.get("BESELL_ARCHIVE_DIR") or (DATA_DIR / "archive"))
+ARCHIVE_MANIFEST = ARCHIVE_DIR / "_manifest.json"
+ARCHIVE_RECENT_MONTHS = 2  # months always rebuilt, since users may still correct them
+
+def _archive_schema():
+    import pyarrow as pa
+    return pa.schema([
+        ("date", pa.date32()),
+        ("email", pa.dictionary(pa.int32(), pa.string())),
+        ("product", pa.dictionary(pa.int32(), pa.string())),
+        ("qty", pa.int32()),
+        ("unit_bonus", pa.int32()),
+        ("bonus", pa.int64()),
+        ("ts", pa.string()),
+    ])
+
+def _archive_path(ym: str) -> Path:
+    return ARCHIVE_DIR / f"month={ym}" / "records.parquet"
+
+def _months_between(start_d: date, end_d: date) -> list:
+    months, d = [], start_d.replace(day=1)
+    while d <= end_d:
+        months.append(d.strftime("%Y-%m"))
+        d = month_bounds(d)[1] + timedelta(days=1)
+    return months
+
+def _records_first_date():
+    if FIREBASE_ENABLED:
+        docs = list(DB.collection("records").order_by("date").limit(1).stream())
+        first = (docs[0].to_dict() or {}).get("date") if docs else None
+    elif SQLITE_ENABLED:
+        with _SqlSession() as conn:
+            first = conn.execute("SELECT MIN(date) FROM records").fetchone()[0]
+    else:
+        first = min((d for days in _load_records_store()["by_email"].values() for d in days), default=None)
+    return date.fromisoformat(first) if first else None
+
+def archive_months() -> dict:
+    """Manifest of archived months: {"YYYY-MM": {rows, qty, bonus, built_at}}."""
+    try:
+        return json.loads(ARCHIVE_MANIFEST.read_text(encoding="utf-8")).get("months", {})
+    except (OSError, ValueError):
+        return {}
+
+def _archive_month(ym: str) -> dict:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    start_d, end_d = month_bounds(date.fromisoformat(f"{ym}-01"))
+    df = pd.DataFrame.from_records(list(_iter_records(start_d.isoformat(), end_d.isoformat())),
+                                   columns=["email", "date", "product", "qty", "ts"])
+    df["qty"] = pd.to_numeric(df["qty"], errors="coerce").fillna(0).astype("int32")
+    df["unit_bonus"] = (_price_records(df) if len(df) else pd.Series(dtype="int64")).astype("int32").to_numpy()
+    df["bonus"] = df["qty"].astype("int64") * df["unit_bonus"]
+    df["date"] = pd.to_datetime(df["date"], format="%Y-%m-%d").dt.date
+    df["ts"] = df["ts"].fillna("").astype(str)
+    df = df.sort_values(["date", "email", "product"], kind="stable")
+    table = pa.Table.from_pandas(df, schema=_archive_schema(), preserve_index=False)
+    path = _archive_path(ym)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = _mkstemp_beside(path)
+    os.close(fd)
+    try:
+        pq.write_table(table, tmp, compression="zstd")
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return {"rows": len(df), "qty": int(df["qty"].sum()), "bonus": int(df["bonus"].sum()), "built_at": now_ij().isoformat()}
+
+def archive_records(rebuild_all: bool = False, recent: int = ARCHIVE_RECENT_MONTHS, progress=None) -> dict:
+    """Write missing and recent month partitions (every month with `rebuild_all`)."""
+    t0 = time.perf_counter()
+    first = _records_first_date()
+    months = _months_between(first, now_ij().date()) if first else []
+    done = archive_months()
+    keep_fresh = set(months[-recent:]) if recent > 0 else set()
+    todo = [ym for ym in months if rebuild_all or ym not in done or ym in keep_fresh]
+    for i, ym in enumerate(todo, 1):
+        done[ym] = _archive_month(ym)
+        ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
+        _write_json(ARCHIVE_MANIFEST, {"months": dict(sorted(done.items()))})
+        if progress:
+            progress(ym, i, len(todo))
+    return {"months": todo, "rows": sum(done[ym]["rows"] for ym in todo), "seconds": round(time.perf_counter() - t0, 2)}
+
+ARCHIVE_SCAN_CACHE = 32  # scans kept per process; a rebuilt month changes their key
+
+def archive_scan(start_d: date, end_d: date, emails=None, columns=None) -> pd.DataFrame:
+    """Archived records between two dates, reading only the month partitions in range.
+
+    Results are kept per process under the manifest's built_at of each month read, so a
+    repeated scan costs no Parquet reads until archive_records() rewrites one of them."""
+    done = archive_months()
+    stamps = tuple((ym, (done.get(ym) or {}).get("built_at")) for ym in _months_between(start_d, end_d))
+    return _archive_scan(start_d, end_d, None if emails is None else tuple(sorted(emails)),
+                         None if columns is None else tuple(columns), stamps).copy()
+
+@lru_cache(maxsize=ARCHIVE_SCAN_CACHE)
+def _archive_scan(start_d: date, end_d: date, emails, columns, stamps) -> pd.DataFrame:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    columns = list(columns) if columns is not None else None
+    filters = [("date", ">=", start_d), ("date", "<=", end_d)]
+    if emails is not None:
+        filters.append(("email", "in", list(emails)))
+    tables = [pq.read_table(path, columns=columns, filters=filters)
+              for path in (_archive_path(ym) for ym, _ in stamps) if path.exists()]
+    if not tables:
+        return pd.DataFrame(columns=columns or _archive_schema().names)
+    return pa.concat_tables(tables, promote_options="permissive").to_pandas()
+
+# --- In-memory Firestore (BESELL_STORAGE=memory) ---
+# The Firestore code path run against bezeq_bonus_memstore instead of a project. Nothing
+# is persisted: like SQLite on its first start, the store is seeded from the local data/
+# files. Reads and writes are counted as Firestore would bill them (storage_usage()), so
+# Firestore-mode costs show up in benchmarks and Diagnostics without credentials.
+# Calling it again starts over from the files (tests do this between cases).
+def init_memory():
+    global FIREBASE_ENABLED, DB, FS_MODULE, FIREBASE_DIAG
+    import bezeq_bonus_memstore as memstore
+    _storage_reset()
+    users = load_users().get("users", {})
+    records = load_records().get("records", [])
+    cfg = load_bonus_config()
+    msgs = load_messages().get("messages", [])
+    sessions = {sid: v for sid, v in _json_sessions().items() if not _session_expired(v.get("expires_at", ""))}
+    inbox = _json_inbox()
+    DB, FS_MODULE, FIREBASE_ENABLED = memstore.Client(), memstore, True
+    FIREBASE_DIAG = {"ok": True, "error": None, "source": "memory", "project_id": None}
+    _invalidate_data_cache(repoll=True)
+    DB.load({
+        "users": {email: {**u, "email": email} for email, u in users.items()},
+        "config": {"bonuses": {"schedules": cfg.get("schedules", []), "products": cfg.get("products", []), "version": int(cfg.get("version", 0) or 0)}},
+        "messages": {m["id"]: m for m in msgs},
+        "sessions": {sid: _fs_session_doc(v, datetime.fromisoformat(v["expires_at"])) for sid, v in sessions.items()},
+        "inbox": {email: {"dismissed": dict(seen)} for email, seen in inbox.items()},
+    })
+    if records:
+        _fs_records_replace_all({"records": records})
+        rebuild_daily_rollups()
+    DB.reset_stats()
+
+def storage_usage():
+    """Read/write counters of the in-memory Firestore, or None on a real backend."""
+    return DB.stats() if FIREBASE_ENABLED and FIREBASE_DIAG.get("source") == "memory" else None
+
+# --- One-time process initialization ---
+init_storage()
+refresh_products()
+_bonus_index()
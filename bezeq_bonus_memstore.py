@@ -0,0 +1,650 @@
+# bezeq_bonus_memstore — in-memory stand-in for the Firestore client used by bezeq_bonus_core.
+# Selected with BESELL_STORAGE=memory: the core's Firestore code path then runs unchanged
+# against process memory (seeded from the local data/ files), so Firestore-mode behaviour
+# and cost can be tested and measured offline. It covers the part of the client the app
+# uses — documents, where/order_by/limit/cursor queries, batches, transactions, snapshot
+# listeners and the Increment/DELETE_FIELD/ArrayUnion/ArrayRemove transforms — with
+# Firestore's rules for ordering, missing fields and value types, and bills reads and
+# writes the way Firestore does. Nothing is persisted.
+# -*- coding: utf-8 -*-
+import copy, enum, functools, random, string, threading
+from datetime import datetime, timezone
+
+MAX_BATCH_WRITES = 500
+MAX_DISJUNCTION = 30  # values allowed in an `in` / `array_contains_any` filter
+TRANSACTION_ATTEMPTS = 5
+ASCENDING, DESCENDING = "ASCENDING", "DESCENDING"
+_INEQUALITY = {"<", "<=", ">", ">=", "!=", "not-in"}
+_MISSING = object()
+
+class NotFound(Exception):
+    """update() of a document that does not exist."""
+
+class Aborted(Exception):
+    """A transaction kept conflicting with concurrent writes."""
+
+class Increment:
+    def __init__(self, value):
+        self.value = value
+
+class ArrayUnion:
+    def __init__(self, values):
+        self.values = list(values)
+
+class ArrayRemove:
+    def __init__(self, values):
+        self.values = list(values)
+
+class _Sentinel:
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return f"Sentinel: {self.name}"
+
+DELETE_FIELD = _Sentinel("DELETE_FIELD")
+SERVER_TIMESTAMP = _Sentinel("SERVER_TIMESTAMP")
+_TRANSFORMS = (Increment, ArrayUnion, ArrayRemove, _Sentinel)
+
+ChangeType = enum.Enum("ChangeType", ["ADDED", "REMOVED", "MODIFIED"])
+
+# --- Values ---
+def _type_rank(v) -> int:
+    # Firestore's cross-type order: null < bool < number < timestamp < string < bytes < reference < array < map
+    if v is None: return 0
+    if isinstance(v, bool): return 1
+    if isinstance(v, (int, float)): return 2
+    if isinstance(v, datetime): return 3
+    if isinstance(v, str): return 4
+    if isinstance(v, bytes): return 5
+    if isinstance(v, DocumentReference): return 6
+    if isinstance(v, list): return 8
+    return 9
+
+def _order_key(v):
+    rank = _type_rank(v)
+    if rank == 3:
+        return (rank, v.timestamp())
+    if rank == 6:
+        return (rank, v.path)
+    if rank == 8:
+        return (rank, tuple(_order_key(x) for x in v))
+    if rank == 9:
+        return (rank, tuple(sorted((k, _order_key(x)) for k, x in v.items())))
+    return (rank, v)
+
+def _encode(v, path: str = "", transforms: bool = True):
+    """Deep copy of a value as Firestore would store it; rejects types it cannot hold."""
+    if isinstance(v, _TRANSFORMS):
+        if not transforms:
+            raise ValueError(f"{v!r} is not allowed inside an array ({path})")
+        return v
+    if v is None or isinstance(v, (bool, str, bytes, DocumentReference)):
+        return v
+    if isinstance(v, int):
+        if not -2 ** 63 <= v < 2 ** 63:
+            raise OverflowError(f"integer out of the 64-bit range at {path}")
+        return v
+    if isinstance(v, (float, datetime)):
+        return v
+    if isinstance(v, (list, tuple, set, frozenset)):
+        return [_encode(x, path, transforms=False) for x in v]
+    if isinstance(v, dict):
+        return {str(k): _encode(x, f"{path}.{k}" if path else str(k), transforms) for k, x in v.items()}
+    raise TypeError(f"Cannot convert to a Firestore Value: {v!r} ({type(v).__name__}) at {path or 'document'}")
+
+def _get_field(data: dict, path: str):
+    cur = data
+    for part in path.split("."):
+        if not isinstance(cur, dict) or part not in cur:
+            return _MISSING
+        cur = cur[part]
+    return cur
+
+def _apply_transform(current, value):
+    if isinstance(value, Increment):
+        return current + value.value if isinstance(current, (int, float)) and not isinstance(current, bool) else value.value
+    if isinstance(value, ArrayUnion):
+        out = list(current) if isinstance(current, list) else []
+        return out + [x for x in value.values if all(_order_key(x) != _order_key(y) for y in out)]
+    if isinstance(value, ArrayRemove):
+        gone = {_order_key(x) for x in value.values}
+        return [x for x in current if _order_key(x) not in gone] if isinstance(current, list) else []
+    if value is SERVER_TIMESTAMP:
+        return datetime.now(timezone.utc)
+    return value
+
+def _merge(target: dict, data: dict, deep: bool):
+    """Write `data` into `target` in place: nested maps are merged when `deep` (set with merge=True)."""
+    for key, value in data.items():
+        if value is DELETE_FIELD:
+            target.pop(key, None)
+        elif isinstance(value, dict) and deep:
+            inner = target.get(key)
+            if not isinstance(inner, dict):
+                inner = target[key] = {}
+            _merge(inner, value, deep)
+        elif isinstance(value, dict):
+            target[key] = {}
+            _merge(target[key], value, deep)
+        else:
+            target[key] = _apply_transform(target.get(key), value)
+
+def _set_path(target: dict, path: str, value):
+    parts = path.split(".")
+    for part in parts[:-1]:
+        if not isinstance(target.get(part), dict):
+            target[part] = {}
+        target = target[part]
+    _merge(target, {parts[-1]: value}, deep=False)
+
+# --- Snapshots and references ---
+class DocumentSnapshot:
+    def __init__(self, reference, data, read_time, update_time=None):
+        self.reference = reference
+        self.id = reference.id
+        self._data = data
+        self.read_time = read_time
+        self.update_time = update_time
+
+    @property
+    def exists(self) -> bool:
+        return self._data is not None
+
+    def to_dict(self):
+        return copy.deepcopy(self._data) if self._data is not None else None
+
+    def get(self, field_path: str):
+        value = _get_field(self._data or {}, field_path)
+        if value is _MISSING:
+            raise KeyError(field_path)
+        return copy.deepcopy(value)
+
+class DocumentChange:
+    def __init__(self, type_, document, old_index=-1, new_index=-1):
+        self.type = type_
+        self.document = document
+        self.old_index = old_index
+        self.new_index = new_index
+
+class Watch:
+    def __init__(self, client, entry):
+        self._client = client
+        self._entry = entry
+
+    def unsubscribe(self):
+        with self._client._lock:
+            if self._entry in self._client._listeners:
+                self._client._listeners.remove(self._entry)
+
+class DocumentReference:
+    def __init__(self, client, collection: str, doc_id: str):
+        self._client = client
+        self._collection = collection
+        self.id = doc_id
+        self.path = f"{collection}/{doc_id}"
+
+    def __eq__(self, other):
+        return isinstance(other, DocumentReference) and other.path == self.path
+
+    def __hash__(self):
+        return hash(self.path)
+
+    def __repr__(self):
+        return f"<DocumentReference {self.path}>"
+
+    @property
+    def parent(self):
+        return CollectionReference(self._client, self._collection)
+
+    def collection(self, name: str):
+        return CollectionReference(self._client, f"{self.path}/{name}")
+
+    def get(self, field_paths=None, transaction=None):
+        if transaction is not None:
+            return transaction._read_doc(self)
+        return self._client._get(self)
+
+    def set(self, document_data: dict, merge: bool = False):
+        self._client._commit([("set", self, document_data, merge)])
+
+    def create(self, document_data: dict):
+        self._client._commit([("create", self, document_data, False)])
+
+    def update(self, field_updates: dict):
+        self._client._commit([("update", self, field_updates, False)])
+
+    def delete(self):
+        self._client._commit([("delete", self, None, False)])
+
+    def on_snapshot(self, callback):
+        return self._client._listen("doc", self, callback)
+
+# --- Queries ---
+class Query:
+    def __init__(self, client, collection: str, filters=(), orders=(), limit=None, start=None, end=None):
+        self._client = client
+        self._collection = collection
+        self._filters = tuple(filters)
+        self._orders = tuple(orders)
+        self._limit = limit
+        self._start = start  # (values, inclusive)
+        self._end = end
+
+    def _copy(self, **changes):
+        args = {"filters": self._filters, "orders": self._orders, "limit": self._limit, "start": self._start, "end": self._end}
+        args.update(changes)
+        return Query(self._client, self._collection, **args)
+
+    def where(self, field_path=None, op_string=None, value=None, filter=None):
+        if filter is not None:
+            field_path, op_string, value = filter.field_path, filter.op_string, filter.value
+        if op_string not in {"==", "!=", "<", "<=", ">", ">=", "in", "not-in", "array_contains", "array_contains_any"}:
+            raise ValueError(f"Operator string {op_string!r} is invalid.")
+        if op_string in ("in", "not-in", "array_contains_any"):
+            if not isinstance(value, (list, tuple)) or not value:
+                raise ValueError(f"'{op_string}' needs a non-empty list")
+            if len(value) > MAX_DISJUNCTION:
+                raise ValueError(f"'{op_string}' supports up to {MAX_DISJUNCTION} comparison values")
+        if field_path == "__name__":
+            value = [self._doc_id(v) for v in value] if isinstance(value, (list, tuple)) else self._doc_id(value)
+        return self._copy(filters=self._filters + ((field_path, op_string, copy.deepcopy(value)),))
+
+    def order_by(self, field_path: str, direction: str = ASCENDING):
+        if self._start is not None or self._end is not None:
+            raise ValueError("order_by must come before a cursor")
+        return self._copy(orders=self._orders + ((field_path, str(direction).upper()),))
+
+    def limit(self, count: int):
+        return self._copy(limit=int(count))
+
+    def start_at(self, document_fields_or_snapshot):
+        return self._copy(start=(self._cursor(document_fields_or_snapshot), True))
+
+    def start_after(self, document_fields_or_snapshot):
+        return self._copy(start=(self._cursor(document_fields_or_snapshot), False))
+
+    def end_at(self, document_fields_or_snapshot):
+        return self._copy(end=(self._cursor(document_fields_or_snapshot), True))
+
+    def end_before(self, document_fields_or_snapshot):
+        return self._copy(end=(self._cursor(document_fields_or_snapshot), False))
+
+    def stream(self, transaction=None):
+        if transaction is not None:
+            return iter(transaction._read_query(self))
+        return iter(self._client._run(self))
+
+    def get(self, transaction=None):
+        return list(self.stream(transaction=transaction))
+
+    def on_snapshot(self, callback):
+        return self._client._listen("query", self, callback)
+
+    def _doc_id(self, value) -> str:
+        return value.id if isinstance(value, DocumentReference) else str(value).rsplit("/", 1)[-1]
+
+    def _effective_orders(self) -> list:
+        # explicit orders, then inequality fields, then the document id in the last direction
+        orders = list(self._orders)
+        named = {f for f, _ in orders}
+        for f in sorted({f for f, op, _ in self._filters if op in _INEQUALITY} - named - {"__name__"}):
+            orders.append((f, ASCENDING))
+        if "__name__" not in {f for f, _ in orders}:
+            orders.append(("__name__", orders[-1][1] if orders else ASCENDING))
+        return orders
+
+    def _cursor(self, fields) -> list:
+        if not self._orders and not isinstance(fields, DocumentSnapshot):
+            raise ValueError("Cursor values need an order_by")
+        orders = self._effective_orders()
+        if isinstance(fields, DocumentSnapshot):
+            data = {**(fields._data or {}), "__name__": fields.id}
+            return [_get_field(data, f) if f != "__name__" else fields.id for f, _ in orders]
+        if isinstance(fields, dict):
+            values = []
+            for f, _ in orders[: len(fields)]:
+                if f not in fields:
+                    raise ValueError(f"Cursor is missing the order_by field {f!r}")
+                values.append(self._doc_id(fields[f]) if f == "__name__" else fields[f])
+            return values
+        return [self._doc_id(v) if f == "__name__" else v for (f, _), v in zip(orders, fields)]
+
+    def _matches(self, doc_id: str, data: dict) -> bool:
+        for field, op, value in self._filters:
+            v = doc_id if field == "__name__" else _get_field(data, field)
+            if v is _MISSING:
+                return False
+            if op == "==":
+                ok = _order_key(v) == _order_key(value)
+            elif op == "!=":
+                ok = v is not None and _order_key(v) != _order_key(value)
+            elif op in ("<", "<=", ">", ">="):
+                # range filters only match values of the same type
+                a, b = _order_key(v), _order_key(value)
+                ok = a[0] == b[0] and {"<": a < b, "<=": a <= b, ">": a > b, ">=": a >= b}[op]
+            elif op == "in":
+                ok = any(_order_key(v) == _order_key(x) for x in value)
+            elif op == "not-in":
+                ok = v is not None and all(_order_key(v) != _order_key(x) for x in value)
+            elif op == "array_contains":
+                ok = isinstance(v, list) and any(_order_key(x) == _order_key(value) for x in v)
+            else:
+                ok = isinstance(v, list) and any(_order_key(x) == _order_key(y) for x in v for y in value)
+            if not ok:
+                return False
+        return True
+
+    def _sort_key(self, orders, doc_id: str, data: dict):
+        return [_order_key(doc_id if f == "__name__" else _get_field(data, f)) for f, _ in orders]
+
+    def _past(self, key, orders, cursor, inclusive: bool, after: bool) -> bool:
+        """Whether a sort key lies after (or before) a cursor in query order."""
+        for k, (_, direction), c in zip(key, orders, cursor):
+            c = _order_key(c)
+            if k != c:
+                gt = (k > c) != (direction == DESCENDING)
+                return gt if after else not gt
+        return inclusive
+
+    def _select(self, docs: dict) -> list:
+        """(id, data) pairs this query returns from a collection's documents."""
+        orders = self._effective_orders()
+        rows = []
+        for doc_id, data in docs.items():
+            if not self._matches(doc_id, data):
+                continue
+            # documents without an ordered field are left out, as in Firestore
+            if any(f != "__name__" and _get_field(data, f) is _MISSING for f, _ in orders):
+                continue
+            rows.append((self._sort_key(orders, doc_id, data), doc_id, data))
+        for i in reversed(range(len(orders))):
+            rows.sort(key=lambda r: r[0][i], reverse=orders[i][1] == DESCENDING)
+        if self._start is not None:
+            cursor, inclusive = self._start
+            rows = [r for r in rows if self._past(r[0], orders, cursor, inclusive, after=True)]
+        if self._end is not None:
+            cursor, inclusive = self._end
+            rows = [r for r in rows if self._past(r[0], orders, cursor, inclusive, after=False)]
+        if self._limit is not None:
+            rows = rows[: self._limit]
+        return [(doc_id, data) for _, doc_id, data in rows]
+
+class CollectionReference(Query):
+    def __init__(self, client, path: str):
+        super().__init__(client, path)
+        self.id = path.rsplit("/", 1)[-1]
+
+    def document(self, document_id: str | None = None):
+        return DocumentReference(self._client, self._collection, document_id or _auto_id())
+
+    def add(self, document_data: dict, document_id: str | None = None):
+        ref = self.document(document_id)
+        ref.create(document_data)
+        return datetime.now(timezone.utc), ref
+
+    def list_documents(self):
+        with self._client._lock:
+            ids = list(self._client._data.get(self._collection, {}))
+        return [self.document(i) for i in ids]
+
+def _auto_id() -> str:
+    return "".join(random.choices(string.ascii_letters + string.digits, k=20))
+
+# --- Writes ---
+class WriteBatch:
+    def __init__(self, client):
+        self._client = client
+        self._writes = []
+
+    def set(self, reference, document_data: dict, merge: bool = False):
+        self._writes.append(("set", reference, document_data, merge))
+
+    def create(self, reference, document_data: dict):
+        self._writes.append(("create", reference, document_data, False))
+
+    def update(self, reference, field_updates: dict):
+        self._writes.append(("update", reference, field_updates, False))
+
+    def delete(self, reference):
+        self._writes.append(("delete", reference, None, False))
+
+    def commit(self):
+        if len(self._writes) > MAX_BATCH_WRITES:
+            raise ValueError(f"maximum {MAX_BATCH_WRITES} writes allowed per request")
+        writes, self._writes = self._writes, []
+        return self._client._commit(writes)
+
+class Transaction(WriteBatch):
+    def __init__(self, client):
+        super().__init__(client)
+        self._read_versions = {}
+
+    def _check_read(self):
+        if self._writes:
+            raise ValueError("Firestore transactions require all reads to be executed before all writes.")
+
+    def _read_doc(self, ref):
+        self._check_read()
+        snap = self._client._get(ref)
+        self._read_versions[ref.path] = self._client._versions.get(ref.path, 0)
+        return snap
+
+    def _read_query(self, query):
+        self._check_read()
+        docs = self._client._run(query)
+        for d in docs:
+            self._read_versions[d.reference.path] = self._client._versions.get(d.reference.path, 0)
+        return docs
+
+    def get(self, ref_or_query):
+        if isinstance(ref_or_query, DocumentReference):
+            return iter([self._read_doc(ref_or_query)])
+        return iter(self._read_query(ref_or_query))
+
+def transactional(fn):
+    """Run fn(transaction, ...) and commit its writes, retrying while documents it read changed."""
+    @functools.wraps(fn)
+    def run(transaction, *args, **kwargs):
+        for attempt in range(TRANSACTION_ATTEMPTS):
+            transaction._writes, transaction._read_versions = [], {}
+            result = fn(transaction, *args, **kwargs)
+            writes, transaction._writes = transaction._writes, []
+            if transaction._client._commit(writes, expect=transaction._read_versions):
+                return result
+        raise Aborted(f"transaction failed after {TRANSACTION_ATTEMPTS} attempts")
+    return run
+
+# --- Client ---
+class Client:
+    """The in-memory database; counters are in stats()."""
+
+    def __init__(self):
+        self._data = {}  # collection path -> {document id -> data}
+        self._versions = {}  # document path -> write count, for transaction conflicts
+        self._updated = {}
+        self._listeners = []
+        self._indexes = {}  # (collection, field) -> {value key -> ids}, built on first equality query
+        self._lock = threading.RLock()
+        self.reset_stats()
+
+    # public surface
+    def collection(self, path: str):
+        return CollectionReference(self, path)
+
+    def document(self, path: str):
+        col, _, doc_id = path.rpartition("/")
+        return DocumentReference(self, col, doc_id)
+
+    def batch(self):
+        return WriteBatch(self)
+
+    def transaction(self, **kwargs):
+        return Transaction(self)
+
+    def collections(self):
+        with self._lock:
+            return [CollectionReference(self, c) for c in sorted(self._data) if "/" not in c]
+
+    def load(self, collections: dict):
+        """Bulk-load {collection: {id: data}} without counting writes or notifying listeners."""
+        with self._lock:
+            for col, docs in collections.items():
+                target = self._data.setdefault(col, {})
+                for doc_id, data in docs.items():
+                    target[str(doc_id)] = _encode(data)
+                for key in [k for k in self._indexes if k[0] == col]:
+                    del self._indexes[key]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return copy.deepcopy(self._stats)
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = {"reads": 0, "writes": 0, "deletes": 0, "queries": 0, "commits": 0, "by_collection": {}}
+
+    # internals
+    def _count(self, collection: str, kind: str, n: int = 1):
+        self._stats[kind] += n
+        per = self._stats["by_collection"].setdefault(collection, {"reads": 0, "writes": 0, "deletes": 0})
+        per[kind] += n
+
+    def _get(self, ref) -> DocumentSnapshot:
+        with self._lock:
+            data = self._data.get(ref._collection, {}).get(ref.id)
+            self._count(ref._collection, "reads")
+            return DocumentSnapshot(ref, copy.deepcopy(data), datetime.now(timezone.utc), self._updated.get(ref.path))
+
+    def _index(self, collection: str, field: str) -> dict:
+        index = self._indexes.get((collection, field))
+        if index is None:
+            index = self._indexes[(collection, field)] = {}
+            for doc_id, data in self._data.get(collection, {}).items():
+                self._index_add(index, field, doc_id, data)
+        return index
+
+    def _index_add(self, index: dict, field: str, doc_id: str, data, remove: bool = False):
+        value = _get_field(data, field) if data is not None else _MISSING
+        if value is _MISSING:
+            return
+        ids = index.setdefault(_order_key(value), set())
+        ids.discard(doc_id) if remove else ids.add(doc_id)
+
+    def _candidates(self, query) -> dict:
+        """The documents a query has to look at: narrowed by its first ==/in filter, like an index would."""
+        docs = self._data.get(query._collection, {})
+        for field, op, value in query._filters:
+            if field != "__name__" and op in ("==", "in"):
+                index = self._index(query._collection, field)
+                keys = [_order_key(value)] if op == "==" else [_order_key(v) for v in value]
+                ids = set().union(*(index.get(k, ()) for k in keys))
+                return {i: docs[i] for i in ids}
+        return docs
+
+    def _run(self, query) -> list:
+        with self._lock:
+            rows = query._select(self._candidates(query))
+            # a query costs one read per document returned, and at least one
+            self._stats["queries"] += 1
+            self._count(query._collection, "reads", max(1, len(rows)))
+            now = datetime.now(timezone.utc)
+            return [DocumentSnapshot(DocumentReference(self, query._collection, i), copy.deepcopy(d), now,
+                                     self._updated.get(f"{query._collection}/{i}")) for i, d in rows]
+
+    def _commit(self, writes: list, expect: dict | None = None):
+        with self._lock:
+            if expect is not None and any(self._versions.get(p, 0) != v for p, v in expect.items()):
+                return False
+            # validate everything first so a failing write leaves the whole commit unapplied
+            staged = {}
+            for kind, ref, data, merge in writes:
+                current = staged[ref.path][1] if ref.path in staged else self._data.get(ref._collection, {}).get(ref.id)
+                if kind == "update" and current is None:
+                    raise NotFound(f"No document to update: {ref.path}")
+                if kind == "create" and current is not None:
+                    raise ValueError(f"Document already exists: {ref.path}")
+                if kind == "delete":
+                    new = None
+                elif kind == "update":
+                    new = copy.deepcopy(current)
+                    for path, value in _encode(data).items():
+                        _set_path(new, path, value)
+                else:
+                    encoded = _encode(data)
+                    if not merge and any(v is DELETE_FIELD for v in encoded.values()):
+                        raise ValueError("DELETE_FIELD needs merge=True or update()")
+                    new = copy.deepcopy(current) if merge and current is not None else {}
+                    _merge(new, encoded, deep=bool(merge))
+                staged[ref.path] = (ref, new, staged[ref.path][2] if ref.path in staged else current)
+            now = datetime.now(timezone.utc)
+            changes = []
+            for path, (ref, new, before) in staged.items():
+                col = self._data.setdefault(ref._collection, {})
+                for (c, field), index in self._indexes.items():
+                    if c == ref._collection:
+                        self._index_add(index, field, ref.id, before, remove=True)
+                        self._index_add(index, field, ref.id, new)
+                if new is None:
+                    col.pop(ref.id, None)
+                else:
+                    col[ref.id] = new
+                self._versions[path] = self._versions.get(path, 0) + 1
+                self._updated[path] = now
+                changes.append((ref, before, new))
+            for kind, ref, _, _ in writes:
+                self._count(ref._collection, "deletes" if kind == "delete" else "writes")
+            self._stats["commits"] += 1
+            listeners = list(self._listeners)
+        # listeners run after the lock is released, like the SDK's background thread
+        for entry in listeners:
+            self._notify(entry, changes)
+        return True
+
+    def _listen(self, kind: str, target, callback):
+        entry = (kind, target, callback)
+        with self._lock:
+            self._listeners.append(entry)
+            if kind == "doc":
+                snaps = [self._get(target)]
+                changes = [DocumentChange(ChangeType.ADDED, snaps[0], -1, 0)] if snaps[0].exists else []
+            else:
+                snaps = self._run(target)
+                changes = [DocumentChange(ChangeType.ADDED, s, -1, i) for i, s in enumerate(snaps)]
+        callback(snaps, changes, datetime.now(timezone.utc))
+        return Watch(self, entry)
+
+    def _notify(self, entry, changes: list):
+        kind, target, callback = entry
+        if kind == "doc":
+            hit = [(before, new) for ref, before, new in changes if ref.path == target.path]
+            if not hit:
+                return
+            before, new = hit[-1]
+            with self._lock:
+                self._count(target._collection, "reads")
+            snap = DocumentSnapshot(target, copy.deepcopy(new), datetime.now(timezone.utc), self._updated.get(target.path))
+            type_ = ChangeType.REMOVED if new is None else ChangeType.ADDED if before is None else ChangeType.MODIFIED
+            callback([snap], [DocumentChange(type_, snap)], snap.read_time)
+            return
+        doc_changes = []
+        for ref, before, new in changes:
+            if ref._collection != target._collection:
+                continue
+            was = before is not None and target._matches(ref.id, before)
+            now_in = new is not None and target._matches(ref.id, new)
+            if not (was or now_in):
+                continue
+            snap = DocumentSnapshot(ref, copy.deepcopy(new if now_in else before), datetime.now(timezone.utc), self._updated.get(ref.path))
+            doc_changes.append(DocumentChange(ChangeType.MODIFIED if was and now_in else ChangeType.ADDED if now_in else ChangeType.REMOVED, snap))
+        if not doc_changes:
+            return
+        with self._lock:
+            # listeners are billed one read per changed document
+            self._count(target._collection, "reads", len(doc_changes))
+            docs = [DocumentSnapshot(DocumentReference(self, target._collection, i), copy.deepcopy(d), datetime.now(timezone.utc))
+                    for i, d in target._select(self._data.get(target._collection, {}))]
+        callback(docs, doc_changes, datetime.now(timezone.utc))
+
+def client() -> Client:
+    return Client()
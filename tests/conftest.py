@@ -0,0 +1,63 @@
+"""Shared setup: the core runs over a small synthetic data/ directory, once per backend.
+
+bezeq_bonus_core initializes its storage at import time from ./data, so the session
+fixture imports it once from a temporary directory. Every test then gets its own copy
+of the generated files and starts over on the backend it is parametrized with: the
+in-memory Firestore stand-in, the local JSON files or SQLite. Tests that only make
+sense on one backend ask for it with `@pytest.mark.parametrize("core", [...], indirect=True)`.
+"""
+import os, shutil, sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.hot_paths import ANCHOR, generate
+
+BACKENDS = ["memory", "json", "sqlite"]
+
+
+@pytest.fixture(scope="session")
+def seed(tmp_path_factory) -> dict:
+    """What generate() wrote, plus where: the history ends on ANCHOR whatever day it is."""
+    data_dir = tmp_path_factory.mktemp("seed") / "data"
+    return {**generate(data_dir, users=12, days=30, anchor=ANCHOR), "dir": data_dir}
+
+
+@pytest.fixture(scope="session")
+def core_module(tmp_path_factory, seed):
+    workdir = tmp_path_factory.mktemp("besell")
+    shutil.copytree(seed["dir"], workdir / "data")
+    cwd, storage = os.getcwd(), os.environ.get("BESELL_STORAGE")
+    os.chdir(workdir)
+    os.environ["BESELL_STORAGE"] = "memory"
+    try:
+        import bezeq_bonus_core
+        yield bezeq_bonus_core
+    finally:
+        os.chdir(cwd)
+        if storage is None:
+            os.environ.pop("BESELL_STORAGE", None)
+        else:
+            os.environ["BESELL_STORAGE"] = storage
+
+
+@pytest.fixture(params=BACKENDS)
+def core(request, core_module, seed, tmp_path, monkeypatch):
+    shutil.copytree(seed["dir"], tmp_path / "data")
+    monkeypatch.chdir(tmp_path)
+    if request.param == "memory":
+        core_module.init_memory()
+    else:
+        core_module._storage_reset()
+        if request.param == "sqlite":
+            core_module.init_sqlite()
+            assert core_module.SQLITE_ENABLED, core_module.FIREBASE_DIAG
+    return core_module
+
+
+@pytest.fixture
+def today():
+    return ANCHOR
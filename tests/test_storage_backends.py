@@ -0,0 +1,164 @@
+"""bezeq_bonus_core run against each storage backend (see conftest.py).
+
+On the in-memory Firestore client these also pin the document reads and writes each
+operation costs, as counted by storage_usage(); a change that adds Firestore round trips
+shows up here.
+"""
+import copy
+
+import pytest
+
+memory_only = pytest.mark.parametrize("core", ["memory"], indirect=True)
+
+
+def counted(core) -> bool:
+    return core.storage_usage() is not None
+
+
+def usage(core, collection=None, kind="reads"):
+    stats = core.storage_usage()
+    if collection is None:
+        return stats[kind]
+    return stats["by_collection"].get(collection, {}).get(kind, 0)
+
+
+@pytest.fixture
+def agent(core):
+    return core.all_users_list()[1]
+
+
+def test_seeded_from_the_data_files(core, seed):
+    assert len(core.load_users()["users"]) == seed["users"]
+    assert len(core.load_records()["records"]) == seed["records"]
+
+
+@memory_only
+def test_memory_seed_is_served_by_the_mirror(core, seed):
+    assert len(list(core.DB.collection("records").stream())) == seed["records"]
+    assert core._rollups_ready()
+    core.DB.reset_stats()
+    core.load_users()
+    assert usage(core) == 0  # served by the live mirror
+
+
+def test_saving_a_day_is_one_transaction(core, agent, today):
+    email = agent["email"]
+    if counted(core):
+        core.DB.reset_stats()
+    core.add_or_set_counts(email, today, {"fiber_new": 2, "cyber_plus": 1})
+    counts = core.get_counts_for_user_date(email, today)
+    assert counts["fiber_new"] == 2 and counts["cyber_plus"] == 1
+    assert sum(counts.values()) == 3
+    if counted(core):
+        assert usage(core, "records", "writes") == 2
+        assert usage(core, "daily_rollups", "writes") == 1
+        assert usage(core, "leaderboards", "writes") == 2  # this user's week and month shards
+        assert usage(core, "config", "writes") == 1  # one data-version bump
+        assert usage(core, kind="commits") == 2
+        month = core.leaderboard_periods(today)["month"]
+        shard = core.DB.collection("leaderboards").document(f"{month}#{core._leaderboard_shard(email)}").get().to_dict()
+        assert set(shard["scores"]) == {email}
+
+
+def test_cached_reads_cost_nothing_until_a_write(core, agent, today):
+    email = agent["email"]
+    month_start = today.replace(day=1)
+    before = core.aggregate_user_counts(email, month_start, today)
+    if counted(core):
+        core.DB.reset_stats()
+    assert core.aggregate_user_counts(email, month_start, today) == before
+    if counted(core):
+        assert usage(core) == 0
+    day = core.get_counts_for_user_date(email, today)
+    core.add_or_set_counts(email, today, {**day, "mesh_fiber": day["mesh_fiber"] + 3})
+    if counted(core):
+        core.DB.reset_stats()
+    assert core.aggregate_user_counts(email, month_start, today)["mesh_fiber"] == before["mesh_fiber"] + 3
+    if counted(core):
+        assert usage(core) > 0
+
+
+@memory_only
+def test_mirrored_writes_skip_the_version_document(core, agent):
+    core.load_users(), core.load_messages(), core.load_bonus_config()  # listeners attached
+    core.DB.reset_stats()
+    core.set_last_login(agent["email"])
+    core.update_user(agent["email"], name="שם חדש")
+    core.create_message("hello", True, [], [])
+    core.save_products(core.load_products())
+    assert usage(core, "config", "writes") == 1  # the bonus config itself, no config/version
+    assert core.load_users()["users"][agent["email"]]["name"] == "שם חדש"
+
+
+def test_delete_user_removes_their_sessions(core, agent):
+    email = agent["email"]
+    sid, _ = core.start_user_session(email)
+    other, _ = core.start_user_session(core.all_users_list()[2]["email"])
+    assert core.get_user_by_session(sid)["email"] == email
+    core.delete_user(email)
+    if counted(core):
+        assert not list(core.DB.collection("sessions").where("email", "==", email).stream())
+    assert core.get_user_by_session(sid) is None
+    assert core.get_user_by_session(other) is not None
+
+
+@memory_only
+def test_bonus_version_comes_from_storage(core):
+    stored = core.DB.collection("config").document("bonuses").get().to_dict()
+    # another process saved twice; this one's listener has not delivered it yet
+    core.DB.load({"config": {"bonuses": {**stored, "version": 41}}})
+    core.save_bonus_schedules(core.load_bonus_schedules())
+    assert core.DB.collection("config").document("bonuses").get().to_dict()["version"] == 42
+    assert core._bonus_index()["version"] == 42
+
+
+@memory_only
+def test_prices_saved_elsewhere_reach_the_index(core):
+    before = core.get_bonus_for("fiber_new", "2000-01-01")
+    ref = core.DB.collection("config").document("bonuses")
+    data = copy.deepcopy(ref.get().to_dict())
+    data["schedules"][0]["prices"]["fiber_new"] = before + 5
+    data["version"] += 1
+    ref.set(data)  # delivered through the bonuses listener, no local write
+    assert core.get_bonus_for("fiber_new", "2000-01-01") == before + 5
+
+
+def test_leaderboard_rebuild_keeps_a_concurrent_save(core, agent, today, monkeypatch):
+    email = agent["email"]
+    key = core.leaderboard_periods(today)["month"]
+    core._leaderboards_drop([key])
+    store, stored = core._leaderboard_store, []
+
+    def racing(*args):
+        if not stored:
+            core.add_or_set_counts(email, today, {"bizfiber_fiber": 4})
+        stored.append(store(*args))
+        return stored[-1]
+
+    monkeypatch.setattr(core, "_leaderboard_store", racing)
+    core.leaderboard_top(key)
+    assert stored == [False]  # the save landed mid-rebuild, so that rebuild is dropped
+    start_d, end_d = core._leaderboard_range(key)
+    expected = core.sum_bonus_for_email_range(email, start_d, end_d)
+    assert dict(core.leaderboard_top(key, k=100))[email] == expected
+    assert stored == [False, True]
+
+
+def test_empty_email_selection_reads_nothing(core):
+    if counted(core):
+        core.DB.reset_stats()
+    assert list(core._iter_records("2000-01-01", "2100-01-01", [])) == []
+    if counted(core):
+        assert usage(core) == 0
+
+
+def test_inbox_lists_follow_the_receipts(core, agent):
+    unread = core.eligible_messages_for_user(agent)
+    assert unread
+    core.mark_dismissed_for_user(unread[0]["id"], agent["email"])
+    assert unread[0]["id"] not in {m["id"] for m in core.eligible_messages_for_user(agent)}
+    assert unread[0]["id"] in {m["id"] for m in core.read_messages_for_user(agent)}
+    if counted(core):
+        core.DB.reset_stats()
+        core.eligible_messages_for_user(agent), core.read_messages_for_user(agent)
+        assert usage(core) == 0
@@ -0,0 +1,46 @@
+"""Snapshot sales records into the month-partitioned Parquet archive.
+
+    python tools/archive_records.py [--all] [--recent 2] [--out archive.json]
+
+Writes data/archive/month=YYYY-MM/records.parquet (or under $BESELL_ARCHIVE_DIR) for
+every month that is not archived yet and rebuilds the last --recent months, which users
+may still be correcting. Each partition holds one row per record with the bonus resolved
+at the prices in effect on its day; --all rebuilds every month, e.g. after a price
+schedule changed retroactively. Meant to run periodically (cron, a scheduled job) against
+the same storage as the app; each partition is replaced atomically, so the app can read
+the archive while this runs.
+"""
+import argparse, json, sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def progress(msg: str):
+    print(msg, file=sys.stderr, flush=True)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--all", action="store_true", help="rebuild every month, not just missing and recent ones")
+    ap.add_argument("--recent", type=int, default=None, help="number of trailing months always rebuilt (default 2)")
+    ap.add_argument("--out")
+    args = ap.parse_args()
+
+    sys.path.insert(0, str(ROOT))
+    import bezeq_bonus_core as core
+    if "parquet" not in core.export_formats():
+        raise SystemExit("pyarrow is not installed")
+    recent = core.ARCHIVE_RECENT_MONTHS if args.recent is None else args.recent
+    report = core.archive_records(rebuild_all=args.all, recent=recent,
+                                  progress=lambda ym, done, total: progress(f"archived {ym} ({done}/{total})"))
+    report["archive_dir"] = str(core.ARCHIVE_DIR)
+    report["archived_months"] = len(core.archive_months())
+    text = json.dumps(report, indent=2)
+    if args.out:
+        Path(args.out).write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
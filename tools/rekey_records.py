@@ -0,0 +1,200 @@
+"""Re-key Firestore sales records to one document per user, day and product.
+
+    python tools/rekey_records.py [--dry-run] [--before YYYY-MM-DD] [--page 1000] [--out rekey.json]
+
+Streams `records` in pages to find the user-days that still hold random-id or duplicate
+(email, date, product) rows. Each such day is then folded into the keyed documents
+`{email}|{date}|{product}` the app writes today inside its own transaction, which
+re-reads the day first, so a correction saved from the app meanwhile is folded in
+rather than overwritten (and a day the app already re-keyed is left alone). The same
+transaction writes the day's rollup; the daily rollups are only backfilled in full if
+they were never built. Document count, total qty and total bonus of the
+re-keyed days are checksummed as the transactions read them and re-read afterwards;
+days saved from the app after their re-key are left out of the comparison, and the run
+fails if qty or bonus moved on the others. Re-running is safe. Days from --before on
+(default: today) are skipped, since users are most likely saving them; saving a day from
+the app re-keys it anyway. Uses the same Firestore credentials as the app.
+"""
+import argparse, json, sys, time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def progress(msg: str):
+    print(msg, file=sys.stderr, flush=True)
+
+
+def stream_records(col, page: int):
+    """Pages of record snapshots in document-id order."""
+    last = None
+    while True:
+        q = col.order_by("__name__").limit(page)
+        if last is not None:
+            q = q.start_after(last)
+        docs = list(q.stream())
+        if docs:
+            yield docs
+        if len(docs) < page:
+            return
+        last = docs[-1]
+
+
+def tally(total: dict, r: dict, core):
+    total["docs"] += 1
+    total["qty"] += int(r["qty"])
+    total["bonus"] += int(r["qty"]) * core.get_bonus_for(r["product"], r["date"])
+
+
+def fold_day(docs, core) -> dict:
+    """{keyed id: record} for one user-day's documents, duplicates summed."""
+    folded = {}
+    for d in docs:
+        r = d.to_dict() or {}
+        if not {"email", "date", "product", "qty"} <= set(r):
+            continue
+        key = core._record_id(r["email"], r["date"], r["product"])
+        rec = folded.setdefault(key, {"email": r["email"], "date": r["date"], "product": r["product"], "qty": 0, "ts": ""})
+        rec["qty"] += int(r["qty"])
+        rec["ts"] = max(rec["ts"], r.get("ts", "") or "")
+    return folded
+
+
+def day_total(docs, core) -> dict:
+    total = {"docs": 0, "qty": 0, "bonus": 0}
+    for d in docs:
+        r = d.to_dict() or {}
+        if {"email", "date", "product", "qty"} <= set(r):
+            tally(total, r, core)
+    return total
+
+
+def rekey_day(col, email: str, date_s: str, core):
+    """Re-key one user-day in a transaction; (checksum as read, documents deleted), or None if already keyed."""
+    q = col.where("email", "==", email).where("date", "==", date_s)
+    rollup_ref = core.DB.collection("daily_rollups").document(core._rollup_id(email, date_s))
+
+    @core.FS_MODULE.transactional
+    def run(transaction):
+        docs = list(q.stream(transaction=transaction))
+        rollup_ref.get(transaction=transaction)  # an app save of this day conflicts with us
+        folded = fold_day(docs, core)
+        stale = [d for d in docs if d.id not in folded]
+        if not stale:
+            return None
+        for key, rec in folded.items():
+            transaction.set(col.document(key), rec)
+        for d in stale:
+            transaction.delete(d.reference)
+        counts = {r["product"]: r["qty"] for r in folded.values()}
+        ts = max(r["ts"] for r in folded.values())
+        transaction.set(rollup_ref, {**core._day_rollup(email, date_s, counts, ts), "keyed": True})
+        return day_total(docs, core), len(stale)
+
+    return run(core.DB.transaction())
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--dry-run", action="store_true", help="report what would change without writing")
+    ap.add_argument("--before", default=date.today().isoformat(), help="only re-key days earlier than this ISO date")
+    ap.add_argument("--page", type=int, default=1000)
+    ap.add_argument("--skip-rollups", action="store_true", help="do not backfill daily_rollups afterwards")
+    ap.add_argument("--out")
+    args = ap.parse_args()
+
+    sys.path.insert(0, str(ROOT))
+    import bezeq_bonus_core as core
+    if not core.FIREBASE_ENABLED:
+        raise SystemExit(f"Firestore is not configured: {core.FIREBASE_DIAG.get('error') or 'no credentials found'}")
+    col = core.DB.collection("records")
+    t0 = time.perf_counter()
+
+    total = {"docs": 0, "qty": 0, "bonus": 0}
+    groups, days, recent, invalid = {}, set(), 0, 0
+    started = core.now_ij().isoformat()
+    for docs in stream_records(col, args.page):
+        for d in docs:
+            r = d.to_dict() or {}
+            if not {"email", "date", "product", "qty"} <= set(r):
+                invalid += 1
+                continue
+            tally(total, r, core)
+            if r["date"] >= args.before:
+                recent += 1
+                continue
+            key = core._record_id(r["email"], r["date"], r["product"])
+            g = groups.setdefault(key, {"day": (r["email"], r["date"]), "total": {"docs": 0, "qty": 0, "bonus": 0}, "ids": []})
+            tally(g["total"], r, core)
+            g["ids"].append(d.id)
+            if len(g["ids"]) > 1 or d.id != key:
+                days.add((r["email"], r["date"]))
+        progress(f"read {total['docs'] + invalid} documents, {len(groups)} keys")
+
+    deletes = sum(len([i for i in g["ids"] if i != key]) for key, g in groups.items())
+    progress(f"{len(days)} days to re-key, {deletes} documents to delete")
+
+    before = {"docs": 0, "qty": 0, "bonus": 0}
+    after = {"docs": 0, "qty": 0, "bonus": 0}
+    rekeyed, deleted, changed = {}, 0, 0
+    if args.dry_run:
+        for g in groups.values():
+            if g["day"] in days:
+                for k in before:
+                    before[k] += g["total"][k]
+                after["docs"] += 1
+        after["qty"], after["bonus"], deleted = before["qty"], before["bonus"], deletes
+    elif days:
+        with ThreadPoolExecutor(max_workers=core.FS_BULK_WORKERS) as pool:
+            futures = {day: pool.submit(rekey_day, col, *day, core) for day in sorted(days)}
+            for done, (day, fut) in enumerate(futures.items(), 1):
+                result = fut.result()
+                if result is not None:
+                    rekeyed[day] = result[0]
+                    deleted += result[1]
+                if done % 500 == 0 or done == len(futures):
+                    progress(f"re-keyed {done}/{len(futures)} days")
+        # a day saved from the app since its re-key holds the user's counts, not ours
+        for (email, date_s), read in rekeyed.items():
+            docs = list(col.where("email", "==", email).where("date", "==", date_s).stream())
+            if not docs or any(((d.to_dict() or {}).get("ts") or "") > started for d in docs):
+                changed += 1
+                continue
+            now = day_total(docs, core)
+            for k in before:
+                before[k] += read[k]
+                after[k] += now[k]
+
+    rollups = None
+    # re-keyed days carry their rollup already; a full rebuild is only the first backfill
+    if not args.dry_run and not args.skip_rollups and not core._rollups_ready():
+        progress("rebuilding daily rollups")
+        rollups = core.rebuild_daily_rollups()
+
+    report = {
+        "dry_run": args.dry_run,
+        "before_date": args.before,
+        "keys": len(groups),
+        "documents": total,
+        "rekeyed_days": len(days) if args.dry_run else len(rekeyed),
+        "deleted": deleted,
+        "skipped_recent": recent,
+        "skipped_invalid": invalid,
+        "changed_since": changed,
+        "checksum_before": before,
+        "checksum_after": after,
+        "rollup_days": rollups,
+        "elapsed_s": round(time.perf_counter() - t0, 3),
+    }
+    text = json.dumps(report, indent=2)
+    if args.out:
+        Path(args.out).write_text(text + "\n", encoding="utf-8")
+    print(text)
+    if not args.dry_run and (after["qty"], after["bonus"]) != (before["qty"], before["bonus"]):
+        raise SystemExit("checksum mismatch: total qty or bonus changed")
+
+
+if __name__ == "__main__":
+    main()